@@ -57,6 +57,10 @@ setup(
             "numpy>=1.24.0",
             "pymupdf>=1.23.0",
         ],
+        "fast": [
+            "rfernet>=0.3",
+            "orjson>=3.8",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -75,6 +79,8 @@ setup(
             "opencv-python>=4.8.0",
             "numpy>=1.24.0",
             "pymupdf>=1.23.0",
+            "rfernet>=0.3",
+            "orjson>=3.8",
         ]
     },
     entry_points={
@@ -16,6 +16,11 @@ from .settings import (
 )
 
 
+# libyaml-backed loader and dumper where PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CDumper', yaml.Dumper)
+
+
 class DeploymentMode(Enum):
     """Deployment mode options."""
     WEB_DEMO = "web_demo"
@@ -76,7 +81,7 @@ class GopnikConfig:
         # Load configuration data
         with open(config_path, 'r', encoding='utf-8') as f:
             if config_path.suffix.lower() in ['.yaml', '.yml']:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_LOADER)
             elif config_path.suffix.lower() == '.json':
                 data = json.load(f)
             else:
@@ -188,7 +193,7 @@ class GopnikConfig:
         
         with open(config_path, 'w', encoding='utf-8') as f:
             if config_path.suffix.lower() in ['.yaml', '.yml']:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2)
+                yaml.dump(config_data, f, Dumper=_YAML_DUMPER, default_flow_style=False, indent=2)
             elif config_path.suffix.lower() == '.json':
                 json.dump(config_data, f, indent=2)
             else:
@@ -4,21 +4,31 @@ Document analyzer for parsing and structure analysis.
 
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
+import importlib
+import importlib.util
 import logging
 import mimetypes
-from PIL import Image
-import fitz  # PyMuPDF
 
 from ..models.processing import Document, DocumentFormat, PageInfo
 from ..models.errors import DocumentProcessingError
 
-# Optional numpy import for advanced features
-try:
-    import numpy as np
-    HAS_NUMPY = True
-except ImportError:
-    np = None
-    HAS_NUMPY = False
+# Optional numpy for advanced features, detected without importing it
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+# PyMuPDF and Pillow are imported by the methods that parse documents, as in
+# core.redaction, so importing the package does not load them
+_LAZY_MODULES = {
+    'fitz': 'fitz',
+    'Image': 'PIL.Image',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(_LAZY_MODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class DocumentAnalyzer:
@@ -169,6 +179,8 @@ class DocumentAnalyzer:
     
     def _extract_pdf_pages(self, pdf_path: Path) -> List[PageInfo]:
         """Extract pages from PDF document."""
+        import fitz  # PyMuPDF
+        
         pages = []
         
         try:
@@ -218,6 +230,8 @@ class DocumentAnalyzer:
     
     def _extract_image_pages(self, image_path: Path) -> List[PageInfo]:
         """Extract page from image document."""
+        from PIL import Image
+        
         try:
             with Image.open(image_path) as img:
                 # Convert to RGB if necessary
@@ -254,6 +268,8 @@ class DocumentAnalyzer:
     
     def _extract_pdf_metadata(self, pdf_path: Path) -> Dict[str, Any]:
         """Extract PDF-specific metadata."""
+        import fitz  # PyMuPDF
+        
         try:
             doc = fitz.open(str(pdf_path))
             metadata = doc.metadata
@@ -280,6 +296,8 @@ class DocumentAnalyzer:
     
     def _extract_image_metadata(self, image_path: Path) -> Dict[str, Any]:
         """Extract image-specific metadata."""
+        from PIL import Image
+        
         try:
             with Image.open(image_path) as img:
                 return {
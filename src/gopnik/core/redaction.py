@@ -4,11 +4,13 @@ Redaction engine for applying redactions while preserving document layout.
 
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter, defaultdict
 import logging
+import os
 import tempfile
 import shutil
-from PIL import Image, ImageDraw, ImageFont
-import fitz  # PyMuPDF
+from concurrent.futures import ProcessPoolExecutor
+import importlib
 import io
 import re
 
@@ -19,6 +21,77 @@ from ..models.processing import Document, DocumentFormat
 from ..models.errors import DocumentProcessingError
 
 
+# Default replacement text for redacted text PII, by type. Visual and
+# unlisted types fall back to a generic marker.
+_DEFAULT_TEXT_REPLACEMENTS = {
+    PIIType.NAME: "[NAME REDACTED]",
+    PIIType.EMAIL: "[EMAIL REDACTED]",
+    PIIType.PHONE: "[PHONE REDACTED]",
+    PIIType.ADDRESS: "[ADDRESS REDACTED]",
+    PIIType.SSN: "[SSN REDACTED]",
+    PIIType.ID_NUMBER: "[ID REDACTED]",
+    PIIType.CREDIT_CARD: "[CARD REDACTED]",
+    PIIType.DATE_OF_BIRTH: "[DOB REDACTED]",
+    PIIType.PASSPORT_NUMBER: "[PASSPORT REDACTED]",
+    PIIType.DRIVER_LICENSE: "[LICENSE REDACTED]",
+    PIIType.MEDICAL_RECORD_NUMBER: "[MEDICAL ID REDACTED]",
+    PIIType.INSURANCE_ID: "[INSURANCE ID REDACTED]",
+    PIIType.BANK_ACCOUNT: "[ACCOUNT REDACTED]",
+    PIIType.IP_ADDRESS: "[IP REDACTED]"
+}
+_GENERIC_REPLACEMENT = "[REDACTED]"
+
+# PyMuPDF and Pillow load large native libraries, so they are imported
+# where they are used rather than whenever the engine module is imported.
+# Module attribute access (e.g. redaction.fitz) still resolves them.
+_LAZY_MODULES = {
+    'fitz': 'fitz',
+    'Image': 'PIL.Image',
+    'ImageDraw': 'PIL.ImageDraw',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(_LAZY_MODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _redact_pdf_pages(pdf_path: str, output_path: str,
+                      page_boxes: Dict[int, List[Tuple[int, int, int, int]]],
+                      fill: Tuple[float, float, float]) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Redact a subset of PDF pages in a worker process.
+    
+    Saves only the redacted pages, in ascending page order, to output_path.
+    
+    Returns:
+        Links left on each redacted page, as returned by Page.get_links().
+        Saving a page subset drops links to pages outside it, so the caller
+        re-creates them from this.
+    """
+    import fitz  # PyMuPDF
+    
+    doc = fitz.open(pdf_path)
+    try:
+        links = {}
+        for page_num, boxes in page_boxes.items():
+            page = doc.load_page(page_num)
+            for box in boxes:
+                page.add_redact_annot(fitz.Rect(*box), fill=fill)
+            page.apply_redactions()
+            links[page_num] = page.get_links()
+            del page
+        
+        doc.select(sorted(page_boxes))
+        doc.save(output_path)
+        return links
+    finally:
+        doc.close()
+
+
 class RedactionEngine(RedactionEngineInterface):
     """
     Applies redactions to documents while preserving layout and structure.
@@ -27,10 +100,21 @@ class RedactionEngine(RedactionEngineInterface):
     supporting different redaction styles and patterns.
     """
     
-    def __init__(self):
+    def __init__(self, temp_dir: Optional[Path] = None):
+        """
+        Initialize redaction engine.
+        
+        Args:
+            temp_dir: Directory for redacted output files, defaults to a
+                shared gopnik_redaction directory under the system temp dir
+        """
         self.logger = logging.getLogger(__name__)
-        self.temp_dir = Path(tempfile.gettempdir()) / "gopnik_redaction"
-        self.temp_dir.mkdir(exist_ok=True)
+        self.temp_dir = Path(temp_dir) if temp_dir is not None else Path(tempfile.gettempdir()) / "gopnik_redaction"
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Minimum number of PDF pages with detections before pages are
+        # redacted in parallel worker processes
+        self.parallel_page_threshold = 4
         
         # Redaction style configurations
         self.style_configs = {
@@ -55,6 +139,13 @@ class RedactionEngine(RedactionEngineInterface):
                 'opacity': 255
             }
         }
+        
+        # Dispatch table resolved for every style, with unconfigured styles
+        # already mapped to the solid black fallback
+        self._style_table = {
+            style: self.style_configs.get(style, self.style_configs[RedactionStyle.SOLID_BLACK])
+            for style in RedactionStyle
+        }
     
     def apply_redactions(self, document_path: Path, detections: List[PIIDetection], 
                         profile: RedactionProfile) -> Path:
@@ -114,51 +205,85 @@ class RedactionEngine(RedactionEngineInterface):
     def _filter_detections_by_profile(self, detections: List[PIIDetection], 
                                     profile: RedactionProfile) -> List[PIIDetection]:
         """Filter detections based on profile settings."""
-        filtered = []
+        # Resolve the profile rules once per call instead of once per detection
+        threshold = profile.confidence_threshold
+        enabled_types = {
+            pii_type for pii_type in PIIType
+            if profile.is_pii_type_enabled(pii_type.value)
+        }
         
-        for detection in detections:
-            # Check if PII type should be redacted according to profile
-            pii_type_str = detection.type.value
-            should_redact = profile.is_pii_type_enabled(pii_type_str)
-            
-            if should_redact:
-                # Check confidence threshold
-                if detection.confidence >= profile.confidence_threshold:
-                    filtered.append(detection)
-                else:
+        filtered = [
+            detection for detection in detections
+            if detection.type in enabled_types and detection.confidence >= threshold
+        ]
+        
+        if len(filtered) != len(detections) and self.logger.isEnabledFor(logging.DEBUG):
+            for detection in detections:
+                if detection.type not in enabled_types:
+                    self.logger.debug(f"Skipping {detection.type.value} detection - not configured for redaction")
+                elif detection.confidence < threshold:
                     self.logger.debug(f"Skipping {detection.type.value} detection due to low confidence: {detection.confidence}")
-            else:
-                self.logger.debug(f"Skipping {detection.type.value} detection - not configured for redaction")
         
         return filtered
     
     def _create_copy(self, document_path: Path) -> Path:
         """Create a copy of the document in temp directory."""
         output_path = self.temp_dir / f"redacted_{document_path.name}"
-        shutil.copy2(document_path, output_path)
+        try:
+            # Kernel-side copy, which can reflink on copy-on-write filesystems
+            with open(document_path, 'rb') as src, open(output_path, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        # Some filesystems report no progress instead of failing
+                        raise OSError("copy_file_range made no progress")
+                    remaining -= copied
+        except (AttributeError, OSError):
+            # copy_file_range is unavailable off Linux or unsupported
+            # between these filesystems
+            shutil.copyfile(document_path, output_path)
+        shutil.copystat(document_path, output_path)
         return output_path
     
     def _apply_pdf_redactions(self, pdf_path: Path, detections: List[PIIDetection], 
                             profile: RedactionProfile) -> Path:
         """Apply redactions to PDF document."""
+        import fitz  # PyMuPDF
+        
         output_path = self.temp_dir / f"redacted_{pdf_path.name}"
         
         try:
             # Open PDF document
             doc = fitz.open(str(pdf_path))
-            
-            # Group detections by page
-            detections_by_page = self._group_detections_by_page(detections)
-            
-            # Apply redactions page by page
-            for page_num, page_detections in detections_by_page.items():
-                if page_num < len(doc):
-                    page = doc.load_page(page_num)
-                    self._apply_pdf_page_redactions(page, page_detections, profile)
-            
-            # Save redacted document
-            doc.save(str(output_path))
-            doc.close()
+            try:
+                # Group detections by page
+                detections_by_page = self._group_detections_by_page(detections)
+                
+                # Apply redactions page by page
+                redacted_doc = None
+                if (len(detections_by_page) >= self.parallel_page_threshold
+                        and (os.cpu_count() or 1) > 1):
+                    redacted_doc = self._apply_pdf_redactions_parallel(
+                        doc, pdf_path, detections_by_page, profile
+                    )
+                if redacted_doc is not None:
+                    doc.close()
+                    doc = redacted_doc
+                else:
+                    for page_num, page_detections in detections_by_page.items():
+                        if page_num < len(doc):
+                            page = doc.load_page(page_num)
+                            self._apply_pdf_page_redactions(page, page_detections, profile)
+                            # Release the page before loading the next one so
+                            # only a single page is held at a time
+                            del page
+                
+                # Save redacted document, collecting unreferenced objects so
+                # content removed by redaction does not linger in the file
+                doc.save(str(output_path), garbage=4, deflate=True, clean=True)
+            finally:
+                doc.close()
             
             self.logger.info(f"Successfully applied PDF redactions to {output_path}")
             return output_path
@@ -166,27 +291,129 @@ class RedactionEngine(RedactionEngineInterface):
         except Exception as e:
             raise DocumentProcessingError(f"PDF redaction failed: {str(e)}") from e
     
+    def _apply_pdf_redactions_parallel(self, doc: 'fitz.Document', pdf_path: Path,
+                                       detections_by_page: Dict[int, List[PIIDetection]],
+                                       profile: RedactionProfile) -> Optional['fitz.Document']:
+        """
+        Redact PDF pages across worker processes and splice them into a copy.
+        
+        Each worker opens its own copy of the PDF, redacts an interleaved
+        share of the pages and saves just those pages. The redacted pages then
+        replace the originals in a fresh copy of the PDF. Replacing a page
+        drops the outline entries and links that point at it, so both are
+        restored afterwards to match serial redaction.
+        
+        Replacing pages also loses form field widgets, page labels and
+        annotations, so documents that have any of them are left to serial
+        redaction.
+        
+        Returns:
+            The redacted document, or None if the caller should fall back to
+            serial redaction. doc itself is never modified.
+        """
+        import fitz  # PyMuPDF
+        
+        page_nums = sorted(page_num for page_num in detections_by_page if page_num < len(doc))
+        if not page_nums:
+            return None
+        
+        if (doc.is_form_pdf or doc.get_page_labels()
+                or any(page.first_annot is not None or page.first_widget is not None
+                       for page in doc)):
+            self.logger.debug("PDF has form fields, page labels or annotations, redacting serially")
+            return None
+        
+        fill = self._get_pdf_fill_color(profile)
+        workers = min(os.cpu_count() or 1, len(page_nums))
+        chunks = [page_nums[i::workers] for i in range(workers)]
+        
+        with tempfile.TemporaryDirectory(dir=self.temp_dir) as work_dir:
+            parts = []
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = []
+                    for index, chunk in enumerate(chunks):
+                        part_path = Path(work_dir) / f"part_{index}.pdf"
+                        page_boxes = {
+                            page_num: [d.bounding_box.to_tuple() for d in detections_by_page[page_num]]
+                            for page_num in chunk
+                        }
+                        futures.append(executor.submit(
+                            _redact_pdf_pages, str(pdf_path), str(part_path), page_boxes, fill
+                        ))
+                        parts.append((chunk, part_path))
+                    
+                    redacted_links = {}
+                    for future in futures:
+                        redacted_links.update(future.result())
+            except Exception as e:
+                self.logger.warning(f"Parallel PDF redaction failed, falling back to serial: {str(e)}")
+                return None
+            
+            # Capture navigation before splicing: redacted pages keep the links
+            # their worker left, other pages keep links into replaced pages
+            toc = doc.get_toc(simple=False)
+            replaced = set(page_nums)
+            page_links = dict(redacted_links)
+            for page in doc:
+                if page.number in replaced:
+                    continue
+                links = page.get_links()
+                if any(link['kind'] == fitz.LINK_GOTO and link.get('page') in replaced for link in links):
+                    page_links[page.number] = links
+            
+            # Splice into a separate copy so a failure part way through
+            # leaves doc intact for the serial fallback
+            redacted = fitz.open(str(pdf_path))
+            try:
+                for chunk, part_path in parts:
+                    part = fitz.open(str(part_path))
+                    try:
+                        for index, page_num in enumerate(chunk):
+                            redacted.delete_page(page_num)
+                            redacted.insert_pdf(part, from_page=index, to_page=index, start_at=page_num)
+                    finally:
+                        part.close()
+                
+                if toc:
+                    redacted.set_toc(toc)
+                for page_num, links in page_links.items():
+                    page = redacted.load_page(page_num)
+                    for link in page.get_links():
+                        page.delete_link(link)
+                    for link in links:
+                        page.insert_link(link)
+                    del page
+            except Exception as e:
+                redacted.close()
+                self.logger.warning(f"Splicing parallel PDF redactions failed, falling back to serial: {str(e)}")
+                return None
+        
+        return redacted
+    
     def _apply_image_redactions(self, image_path: Path, detections: List[PIIDetection], 
                               profile: RedactionProfile) -> Path:
         """Apply redactions to image document."""
+        from PIL import Image
+        
         output_path = self.temp_dir / f"redacted_{image_path.name}"
         
         try:
             # Open image
             with Image.open(image_path) as img:
+                # Decode into memory; redactions then draw straight into this
+                # buffer, the source file is only read, never written
+                img.load()
+                
                 # Convert to RGB if necessary
                 if img.mode not in ('RGB', 'RGBA'):
                     img = img.convert('RGB')
                 
-                # Create a copy for redaction
-                redacted_img = img.copy()
-                
-                # Apply redactions
-                for detection in detections:
-                    if detection.page_number == 0:  # Images are single page
-                        redacted_img = self._apply_image_detection_redaction(
-                            redacted_img, detection, profile
-                        )
+                # Apply redactions (images are single page)
+                page_detections = [d for d in detections if d.page_number == 0]
+                redacted_img = self._apply_image_region_redactions(
+                    img, page_detections, profile
+                )
                 
                 # Save redacted image
                 redacted_img.save(output_path, quality=95, optimize=True)
@@ -199,77 +426,98 @@ class RedactionEngine(RedactionEngineInterface):
     
     def _group_detections_by_page(self, detections: List[PIIDetection]) -> Dict[int, List[PIIDetection]]:
         """Group detections by page number."""
-        grouped = {}
+        grouped = defaultdict(list)
         for detection in detections:
-            page_num = detection.page_number
-            if page_num not in grouped:
-                grouped[page_num] = []
-            grouped[page_num].append(detection)
-        return grouped
+            grouped[detection.page_number].append(detection)
+        return dict(grouped)
     
-    def _apply_pdf_page_redactions(self, page: fitz.Page, detections: List[PIIDetection], 
+    def _apply_pdf_page_redactions(self, page: 'fitz.Page', detections: List[PIIDetection], 
                                  profile: RedactionProfile) -> None:
         """Apply redactions to a single PDF page."""
+        import fitz  # PyMuPDF
+        
+        fill = self._get_pdf_fill_color(profile)
         for detection in detections:
             # Convert coordinates to PDF coordinate system
             bbox = detection.bounding_box
             rect = fitz.Rect(bbox.x1, bbox.y1, bbox.x2, bbox.y2)
             
             # Apply redaction based on profile style
-            if profile.redaction_style == RedactionStyle.SOLID_BLACK:
-                page.add_redact_annot(rect, fill=(0, 0, 0))
-            elif profile.redaction_style == RedactionStyle.SOLID_WHITE:
-                page.add_redact_annot(rect, fill=(1, 1, 1))
-            else:
-                # For other styles, use black as fallback
-                page.add_redact_annot(rect, fill=(0, 0, 0))
+            page.add_redact_annot(rect, fill=fill)
         
         # Apply all redactions
         page.apply_redactions()
     
-    def _apply_image_detection_redaction(self, img: Image.Image, detection: PIIDetection, 
-                                       profile: RedactionProfile) -> Image.Image:
+    @staticmethod
+    def _get_pdf_fill_color(profile: RedactionProfile) -> Tuple[float, float, float]:
+        """Get the PDF redaction fill color for a profile's style."""
+        if profile.redaction_style == RedactionStyle.SOLID_WHITE:
+            return (1, 1, 1)
+        # Solid black, and black as fallback for other styles
+        return (0, 0, 0)
+    
+    def _apply_image_detection_redaction(self, img: 'Image.Image', detection: PIIDetection, 
+                                       profile: RedactionProfile) -> 'Image.Image':
         """Apply redaction to a single detection in an image."""
-        bbox = detection.bounding_box
-        style_config = self.style_configs.get(profile.redaction_style, self.style_configs[RedactionStyle.SOLID_BLACK])
+        return self._apply_image_region_redactions(img, [detection], profile)
+    
+    def _apply_image_region_redactions(self, img: 'Image.Image', detections: List[PIIDetection],
+                                       profile: RedactionProfile) -> 'Image.Image':
+        """Apply redactions for all detections on an image, sharing one drawing context."""
+        if not detections:
+            return img
         
-        # Create drawing context
-        draw = ImageDraw.Draw(img)
+        style_config = self._style_table[profile.redaction_style]
+        pattern = style_config['pattern']
         
         # Apply redaction based on style
-        if style_config['pattern'] is None:
+        if pattern is None:
             # Solid color redaction
+            from PIL import ImageDraw
+            
+            draw = ImageDraw.Draw(img)
             color = style_config['color']
-            draw.rectangle([bbox.x1, bbox.y1, bbox.x2, bbox.y2], fill=color)
+            for detection in detections:
+                bbox = detection.bounding_box
+                draw.rectangle([bbox.x1, bbox.y1, bbox.x2, bbox.y2], fill=color)
             
-        elif style_config['pattern'] == 'pixelate':
+        elif pattern == 'pixelate':
             # Pixelated redaction
-            img = self._apply_pixelation(img, bbox)
+            for detection in detections:
+                img = self._apply_pixelation(img, detection.bounding_box)
             
-        elif style_config['pattern'] == 'blur':
+        elif pattern == 'blur':
             # Blurred redaction
-            img = self._apply_blur(img, bbox)
+            for detection in detections:
+                img = self._apply_blur(img, detection.bounding_box)
         
         return img
     
-    def _apply_pixelation(self, img: Image.Image, bbox) -> Image.Image:
+    def _apply_pixelation(self, img: 'Image.Image', bbox) -> 'Image.Image':
         """Apply pixelation effect to a region."""
-        # Extract region
-        region = img.crop((bbox.x1, bbox.y1, bbox.x2, bbox.y2))
+        from PIL import Image
+        
+        box = (bbox.x1, bbox.y1, bbox.x2, bbox.y2)
         
         # Pixelate by downscaling and upscaling
         pixel_size = max(8, min(bbox.width, bbox.height) // 8)
         small_size = (max(1, bbox.width // pixel_size), max(1, bbox.height // pixel_size))
         
-        # Downsample and upsample
-        pixelated = region.resize(small_size, Image.NEAREST)
+        # Downsample straight from the source region, avoiding an intermediate
+        # crop; Pillow rejects boxes outside the image, which crop pads instead
+        if bbox.x2 <= img.width and bbox.y2 <= img.height:
+            pixelated = img.resize(small_size, Image.NEAREST, box=box)
+        else:
+            pixelated = img.crop(box).resize(small_size, Image.NEAREST)
+        
+        # Upsample
         pixelated = pixelated.resize((bbox.width, bbox.height), Image.NEAREST)
         
         # Paste back
         img.paste(pixelated, (bbox.x1, bbox.y1))
         return img
     
-    def _apply_blur(self, img: Image.Image, bbox) -> Image.Image:
+    def _apply_blur(self, img: 'Image.Image', bbox) -> 'Image.Image':
         """Apply blur effect to a region."""
         from PIL import ImageFilter
         
@@ -297,6 +545,8 @@ class RedactionEngine(RedactionEngineInterface):
         Returns:
             Modified image data with redaction applied
         """
+        from PIL import Image
+        
         try:
             # Convert bytes to PIL Image
             img = Image.open(io.BytesIO(image_data))
@@ -326,59 +576,61 @@ class RedactionEngine(RedactionEngineInterface):
         Returns:
             Modified text content with redaction applied
         """
-        if not detection.text_content:
-            return text_content
+        return self._apply_text_redactions(text_content, [detection], profile)
+    
+    def _apply_text_redactions(self, text_content: str, detections: List[PIIDetection],
+                               profile: RedactionProfile) -> str:
+        """
+        Apply redactions for many detections to text content in a single pass.
         
-        pii_type_str = detection.type.value
-        if not profile.is_pii_type_enabled(pii_type_str):
-            return text_content
+        All detected strings are matched case-insensitively by one compiled
+        alternation, so the text is scanned once rather than once per
+        detection. Where detections overlap, the longest match wins.
+        
+        Args:
+            text_content: Original text content
+            detections: PII detections with text information
+            profile: Redaction profile with style settings
+            
+        Returns:
+            Modified text content with redactions applied
+        """
+        replacements: Dict[str, str] = {}
+        for detection in detections:
+            if not detection.text_content or detection.text_content in replacements:
+                continue
+            if not profile.is_pii_type_enabled(detection.type.value):
+                continue
+            replacements[detection.text_content] = self._get_text_replacement(
+                detection.type, detection.text_content, profile
+            )
         
-        # Get replacement pattern
-        replacement = self._get_text_replacement(detection.type, detection.text_content, profile)
+        if not replacements:
+            return text_content
         
-        # Replace the detected text
         try:
-            # Use regex for more robust replacement
-            escaped_text = re.escape(detection.text_content)
-            pattern = re.compile(escaped_text, re.IGNORECASE)
-            redacted_text = pattern.sub(replacement, text_content)
+            # One group per target; the matching group's index selects the replacement
+            targets = tuple(sorted(replacements, key=len, reverse=True))
+            pattern = re.compile(
+                '|'.join(f'({re.escape(target)})' for target in targets), re.IGNORECASE
+            )
+            values = [replacements[target] for target in targets]
             
-            return redacted_text
+            return pattern.sub(lambda match: values[match.lastindex - 1], text_content)
             
         except Exception as e:
-            self.logger.warning(f"Text redaction failed for '{detection.text_content}': {str(e)}")
+            self.logger.warning(f"Text redaction failed for {len(replacements)} detections: {str(e)}")
             return text_content
     
     def _get_text_replacement(self, pii_type: PIIType, original_text: str, profile: RedactionProfile) -> str:
         """Get appropriate replacement text for PII type."""
         # Check if profile specifies custom replacement in custom_rules
-        pii_type_str = pii_type.value
-        if pii_type_str in profile.custom_rules and 'replacement_text' in profile.custom_rules[pii_type_str]:
-            return profile.custom_rules[pii_type_str]['replacement_text']
-        
-        # Default replacements based on PII type
-        replacements = {
-            PIIType.NAME: "[NAME REDACTED]",
-            PIIType.EMAIL: "[EMAIL REDACTED]",
-            PIIType.PHONE: "[PHONE REDACTED]",
-            PIIType.ADDRESS: "[ADDRESS REDACTED]",
-            PIIType.SSN: "[SSN REDACTED]",
-            PIIType.ID_NUMBER: "[ID REDACTED]",
-            PIIType.CREDIT_CARD: "[CARD REDACTED]",
-            PIIType.DATE_OF_BIRTH: "[DOB REDACTED]",
-            PIIType.PASSPORT_NUMBER: "[PASSPORT REDACTED]",
-            PIIType.DRIVER_LICENSE: "[LICENSE REDACTED]",
-            PIIType.MEDICAL_RECORD_NUMBER: "[MEDICAL ID REDACTED]",
-            PIIType.INSURANCE_ID: "[INSURANCE ID REDACTED]",
-            PIIType.BANK_ACCOUNT: "[ACCOUNT REDACTED]",
-            PIIType.IP_ADDRESS: "[IP REDACTED]"
-        }
+        custom_rule = profile.custom_rules.get(pii_type.value)
+        if isinstance(custom_rule, dict) and 'replacement_text' in custom_rule:
+            return custom_rule['replacement_text']
         
-        # For visual PII, use generic redaction
-        if pii_type in PIIType.visual_types():
-            return "[REDACTED]"
-        
-        return replacements.get(pii_type, "[REDACTED]")
+        # Default replacements based on PII type; visual PII uses generic redaction
+        return _DEFAULT_TEXT_REPLACEMENTS.get(pii_type, _GENERIC_REPLACEMENT)
     
     def get_redaction_statistics(self, detections: List[PIIDetection], 
                                profile: RedactionProfile) -> Dict[str, Any]:
@@ -394,22 +646,11 @@ class RedactionEngine(RedactionEngineInterface):
         """
         filtered_detections = self._filter_detections_by_profile(detections, profile)
         
-        stats = {
+        return {
             'total_detections': len(detections),
             'redacted_detections': len(filtered_detections),
             'skipped_detections': len(detections) - len(filtered_detections),
-            'redaction_by_type': {},
-            'redaction_by_page': {},
+            'redaction_by_type': dict(Counter(d.type.value for d in filtered_detections)),
+            'redaction_by_page': dict(Counter(d.page_number for d in filtered_detections)),
             'redaction_style': profile.redaction_style.value
-        }
-        
-        # Count by type
-        for detection in filtered_detections:
-            pii_type = detection.type.value
-            stats['redaction_by_type'][pii_type] = stats['redaction_by_type'].get(pii_type, 0) + 1
-            
-            # Count by page
-            page_num = detection.page_number
-            stats['redaction_by_page'][page_num] = stats['redaction_by_page'].get(page_num, 0) + 1
-        
-        return stats
\ No newline at end of file
+        }
\ No newline at end of file
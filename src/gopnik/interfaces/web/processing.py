@@ -24,6 +24,9 @@ from .security import SecureFileHandler
 
 logger = logging.getLogger(__name__)
 
+# Largest accepted upload, in bytes (10MB)
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
 
 class WebProcessingJob(BaseModel):
     """Web processing job model."""
@@ -100,8 +103,8 @@ class WebProcessingManager:
                 content = await file.read()
                 f.write(content)
             
-            # Validate file content
-            if not SecureFileHandler.validate_file_content(temp_input_path, file.content_type):
+            # Validate file content from the bytes already in memory
+            if not SecureFileHandler.validate_file_header(content[:1024], file.content_type):
                 self._cleanup_temp_files(temp_files)
                 raise HTTPException(status_code=400, detail="File content doesn't match expected type")
             
@@ -187,11 +190,10 @@ class WebProcessingManager:
     async def _validate_file(self, file: UploadFile):
         """Validate uploaded file."""
         # Check file size (10MB limit)
-        max_size = 10 * 1024 * 1024  # 10MB
         content = await file.read()
         await file.seek(0)  # Reset file pointer
         
-        if len(content) > max_size:
+        if len(content) > MAX_UPLOAD_SIZE:
             raise HTTPException(status_code=413, detail="File too large. Maximum size is 10MB.")
         
         # Check file type
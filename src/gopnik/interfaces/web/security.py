@@ -225,6 +225,21 @@ class SecureFileHandler:
             except Exception:
                 pass
     
+    @staticmethod
+    def validate_file_header(header: bytes, expected_type: str) -> bool:
+        """Validate that leading file bytes match the expected type."""
+        # Basic file type validation based on magic bytes
+        if expected_type == "application/pdf":
+            return header.startswith(b"%PDF-")
+        elif expected_type in ["image/png"]:
+            return header.startswith(b"\x89PNG\r\n\x1a\n")
+        elif expected_type in ["image/jpeg"]:
+            return header.startswith(b"\xff\xd8\xff")
+        elif expected_type in ["image/tiff"]:
+            return header.startswith(b"II*\x00") or header.startswith(b"MM\x00*")
+        
+        return True  # Allow other types for now
+    
     @staticmethod
     def validate_file_content(file_path: Path, expected_type: str) -> bool:
         """Validate file content matches expected type."""
@@ -232,17 +247,7 @@ class SecureFileHandler:
             with open(file_path, "rb") as f:
                 header = f.read(1024)  # Read first 1KB
             
-            # Basic file type validation based on magic bytes
-            if expected_type == "application/pdf":
-                return header.startswith(b"%PDF-")
-            elif expected_type in ["image/png"]:
-                return header.startswith(b"\x89PNG\r\n\x1a\n")
-            elif expected_type in ["image/jpeg"]:
-                return header.startswith(b"\xff\xd8\xff")
-            elif expected_type in ["image/tiff"]:
-                return header.startswith(b"II*\x00") or header.startswith(b"MM\x00*")
-            
-            return True  # Allow other types for now
+            return SecureFileHandler.validate_file_header(header, expected_type)
             
         except Exception as e:
             logger.error(f"File validation error: {str(e)}")
@@ -13,6 +13,8 @@ import platform
 import os
 from pathlib import Path
 
+from .pii import _slotted, _dumps_indented, _loads
+
 
 class AuditOperation(Enum):
     """Types of operations that can be audited."""
@@ -92,6 +94,7 @@ class SystemInfo:
         )
 
 
+@_slotted
 @dataclass
 class AuditLog:
     """
@@ -332,7 +335,7 @@ class AuditLog:
         system_info = SystemInfo.from_dict(system_info_data)
         
         return cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=data['id'] if 'id' in data else str(uuid.uuid4()),
             operation=AuditOperation(data['operation']),
             timestamp=timestamp,
             level=AuditLevel(data.get('level', 'info')),
@@ -359,12 +362,12 @@ class AuditLog:
     
     def to_json(self) -> str:
         """Convert audit log to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return _dumps_indented(self.to_dict())
     
     @classmethod
     def from_json(cls, json_str: str) -> 'AuditLog':
         """Create audit log from JSON string."""
-        data = json.loads(json_str)
+        data = _loads(json_str)
         return cls.from_dict(data)
     
     def to_csv_row(self) -> List[str]:
@@ -580,9 +583,8 @@ class AuditTrail:
             # Write headers
             writer.writerow(AuditLog.get_csv_headers())
             
-            # Write data rows
-            for log in sorted(self.logs, key=lambda x: x.timestamp):
-                writer.writerow(log.to_csv_row())
+            # Stream data rows straight from the logs
+            writer.writerows(log.to_csv_row() for log in sorted(self.logs, key=lambda x: x.timestamp))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert audit trail to dictionary format."""
@@ -609,7 +611,7 @@ class AuditTrail:
         logs = [AuditLog.from_dict(log_data) for log_data in data.get('logs', [])]
         
         return cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=data['id'] if 'id' in data else str(uuid.uuid4()),
             name=data['name'],
             logs=logs,
             created_at=created_at,
@@ -618,12 +620,12 @@ class AuditTrail:
     
     def to_json(self) -> str:
         """Convert audit trail to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return _dumps_indented(self.to_dict())
     
     @classmethod
     def from_json(cls, json_str: str) -> 'AuditTrail':
         """Create audit trail from JSON string."""
-        data = json.loads(json_str)
+        data = _loads(json_str)
         return cls.from_dict(data)
 
 
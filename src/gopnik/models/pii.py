@@ -2,7 +2,8 @@
 PII detection data models and types.
 """
 
-from dataclasses import dataclass, field
+from collections import Counter
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import Tuple, Optional, Dict, Any, List, Union
 import json
@@ -10,6 +11,46 @@ import uuid
 from datetime import datetime
 
 
+# Optional Rust-backed JSON encoder and decoder
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+
+def _dumps_indented(data: Dict[str, Any]) -> str:
+    """
+    Serialize data as JSON indented by two spaces, preferring orjson when installed.
+    
+    Falls back to the json module for values orjson rejects, such as
+    integers wider than 64 bits. Unlike the json module, orjson writes
+    non-finite floats as null, which keeps the output standard JSON.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2)
+
+
+def _loads(json_str: Union[str, bytes]) -> Any:
+    """
+    Parse JSON, preferring orjson when installed.
+    
+    Falls back to the json module for input orjson rejects, such as NaN
+    literals or integers wider than 64 bits.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_str)
+
+
 class PIIType(Enum):
     """Enumeration of supported PII types."""
     # Visual PII types
@@ -56,6 +97,24 @@ class PIIType(Enum):
         ]
 
 
+def _slotted(cls):
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields.
+    
+    Equivalent to ``@dataclass(slots=True)`` (Python 3.10+), which cannot be
+    used while Python 3.8 is supported. Slotted instances carry no per-instance
+    ``__dict__``, which matters when pipelines hold many detections at once.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace['__slots__'] = field_names + ('__weakref__',)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class BoundingBox:
     """
@@ -190,6 +249,7 @@ class BoundingBox:
         }
 
 
+@_slotted
 @dataclass
 class PIIDetection:
     """
@@ -436,7 +496,7 @@ class PIIDetection:
             timestamp = datetime.now()
         
         return cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=data['id'] if 'id' in data else str(uuid.uuid4()),
             type=PIIType(data['type']),
             bounding_box=bounding_box,
             confidence=data['confidence'],
@@ -454,7 +514,7 @@ class PIIDetection:
         Returns:
             JSON representation of detection
         """
-        return json.dumps(self.to_dict(), indent=2)
+        return _dumps_indented(self.to_dict())
     
     @classmethod
     def from_json(cls, json_str: str) -> 'PIIDetection':
@@ -467,7 +527,7 @@ class PIIDetection:
         Returns:
             PIIDetection instance
         """
-        data = json.loads(json_str)
+        data = _loads(json_str)
         return cls.from_dict(data)
 
 @dataclass
@@ -602,16 +662,16 @@ class PIIDetectionCollection:
                 'area_stats': {}
             }
         
-        # Count by type
-        type_counts = {}
-        for detection in self.detections:
-            type_name = detection.type.value
-            type_counts[type_name] = type_counts.get(type_name, 0) + 1
+        # Histograms by type and page; the visual, text and sensitive counts
+        # are derived from the type histogram rather than per detection
+        by_type = Counter(d.type for d in self.detections)
+        page_counts = dict(Counter(d.page_number for d in self.detections))
+        type_counts = {pii_type.value: count for pii_type, count in by_type.items()}
         
-        # Count by page
-        page_counts = {}
-        for detection in self.detections:
-            page_counts[detection.page_number] = page_counts.get(detection.page_number, 0) + 1
+        visual_types = PIIType.visual_types()
+        sensitive_types = PIIType.sensitive_types()
+        visual_count = sum(count for pii_type, count in by_type.items() if pii_type in visual_types)
+        sensitive_count = sum(count for pii_type, count in by_type.items() if pii_type in sensitive_types)
         
         # Confidence statistics
         confidences = [d.confidence for d in self.detections]
@@ -619,7 +679,7 @@ class PIIDetectionCollection:
             'min': min(confidences),
             'max': max(confidences),
             'mean': sum(confidences) / len(confidences),
-            'high_confidence_count': len([c for c in confidences if c >= 0.8])
+            'high_confidence_count': sum(1 for c in confidences if c >= 0.8)
         }
         
         # Area statistics
@@ -637,9 +697,9 @@ class PIIDetectionCollection:
             'by_page': page_counts,
             'confidence_stats': confidence_stats,
             'area_stats': area_stats,
-            'visual_count': len(self.get_visual_detections()),
-            'text_count': len(self.get_text_detections()),
-            'sensitive_count': len(self.get_sensitive_detections())
+            'visual_count': visual_count,
+            'text_count': len(self.detections) - visual_count,
+            'sensitive_count': sensitive_count
         }
     
     def to_dict(self) -> Dict[str, Any]:
@@ -666,12 +726,12 @@ class PIIDetectionCollection:
     
     def to_json(self) -> str:
         """Convert collection to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return _dumps_indented(self.to_dict())
     
     @classmethod
     def from_json(cls, json_str: str) -> 'PIIDetectionCollection':
         """Create collection from JSON string."""
-        data = json.loads(json_str)
+        data = _loads(json_str)
         return cls.from_dict(data)
 
 
@@ -700,15 +760,17 @@ def validate_coordinates(coordinates: Union[Tuple[int, int, int, int], BoundingB
     Returns:
         True if valid coordinates
     """
-    try:
-        if isinstance(coordinates, tuple):
-            BoundingBox.from_tuple(coordinates)
-        elif isinstance(coordinates, BoundingBox):
-            # BoundingBox validates itself in __post_init__
-            pass
-        else:
-            return False
+    if isinstance(coordinates, BoundingBox):
+        # BoundingBox validates itself in __post_init__
         return True
+    if not isinstance(coordinates, tuple):
+        return False
+    
+    # Same rules as BoundingBox.__post_init__, checked without building a
+    # box and raising for every invalid tuple
+    try:
+        x1, y1, x2, y2 = coordinates
+        return 0 <= x1 < x2 and 0 <= y1 < y2
     except (ValueError, TypeError):
         return False
 
@@ -282,7 +282,7 @@ class Document:
         pages = [PageInfo.from_dict(page_data) for page_data in data.get('pages', [])]
         
         return cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=data['id'] if 'id' in data else str(uuid.uuid4()),
             path=Path(data['path']),
             format=DocumentFormat(data['format']),
             pages=pages,
@@ -573,7 +573,7 @@ class ProcessingResult:
             )
         
         return cls(
-            id=data.get('id', str(uuid.uuid4())),
+            id=data['id'] if 'id' in data else str(uuid.uuid4()),
             document_id=data['document_id'],
             input_document=input_document,
             output_path=Path(data['output_path']) if data.get('output_path') else None,
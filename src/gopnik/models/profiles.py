@@ -4,15 +4,71 @@ Redaction profile and style data models.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 import yaml
 import json
 from pathlib import Path
 import copy
 import logging
+import os
+import re
 
 logger = logging.getLogger(__name__)
 
+# Top-level keys needed for inheritance discovery, matched in a profile header
+_HEADER_RE = re.compile(r'^(name|inherits_from):[ \t]*(.*)$', re.M)
+_HEADER_LINES = 20
+
+# Profile file extensions in lookup precedence order
+_PROFILE_EXTENSIONS = ('.yaml', '.yml', '.json')
+
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def _write_file(output_path: Path, data: bytes) -> None:
+    """Write a pre-rendered buffer to disk in as few write calls as possible."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(output_path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _c3_merge(sequences: List[List[str]]) -> List[str]:
+    """
+    Merge parent linearizations with the C3 algorithm used for Python's MRO.
+    
+    Args:
+        sequences: Linearization of each parent followed by the parent list
+        
+    Returns:
+        Merged resolution order
+        
+    Raises:
+        ProfileValidationError: If no consistent resolution order exists
+    """
+    sequences = [list(sequence) for sequence in sequences if sequence]
+    result = []
+    while sequences:
+        for sequence in sequences:
+            head = sequence[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            raise ProfileValidationError(
+                f"Inconsistent inheritance order between: {', '.join(s[0] for s in sequences)}"
+            )
+        result.append(head)
+        for sequence in sequences:
+            if sequence[0] == head:
+                del sequence[0]
+        sequences = [sequence for sequence in sequences if sequence]
+    return result
+
 
 class RedactionStyle(Enum):
     """Redaction style options."""
@@ -79,7 +135,7 @@ class RedactionProfile:
             RedactionProfile instance
         """
         with open(yaml_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
         
         return cls._from_dict(data)
     
@@ -156,8 +212,8 @@ class RedactionProfile:
         Args:
             output_path: Path where to save the YAML file
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, indent=2)
+        data = yaml.dump(self.to_dict(), Dumper=_YAML_DUMPER, default_flow_style=False, indent=2)
+        _write_file(output_path, data.encode('utf-8'))
     
     def save_json(self, output_path: Path) -> None:
         """
@@ -166,8 +222,8 @@ class RedactionProfile:
         Args:
             output_path: Path where to save the JSON file
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        data = json.dumps(self.to_dict(), indent=2)
+        _write_file(output_path, data.encode('utf-8'))
     
     def is_pii_type_enabled(self, pii_type: str) -> bool:
         """
@@ -270,38 +326,56 @@ class RedactionProfile:
         Returns:
             New merged profile
         """
-        # Create a deep copy of the parent
-        merged_data = copy.deepcopy(parent.to_dict())
-        
-        # Override with current profile's values
-        current_data = self.to_dict()
-        
-        # Merge visual rules (child overrides parent)
-        merged_data['visual_rules'].update(current_data['visual_rules'])
-        
-        # Merge text rules (child overrides parent)
-        merged_data['text_rules'].update(current_data['text_rules'])
-        
-        # Merge custom rules (child overrides parent)
-        merged_data['custom_rules'].update(current_data['custom_rules'])
-        
-        # Merge multilingual support (combine both)
-        parent_langs = set(merged_data['multilingual_support'])
-        child_langs = set(current_data['multilingual_support'])
-        merged_data['multilingual_support'] = list(parent_langs.union(child_langs))
-        
-        # Merge metadata (child overrides parent)
-        merged_data['metadata'].update(current_data['metadata'])
-        
-        # Override scalar values with child values
-        for key in ['name', 'description', 'redaction_style', 'confidence_threshold', 'version']:
-            if key in current_data:
-                merged_data[key] = current_data[key]
+        return self._merge_chain([parent])
+    
+    def _merge_chain(self, parents: List['RedactionProfile']) -> 'RedactionProfile':
+        """
+        Merge parent profiles into this profile in a single pass.
         
-        # Clear inheritance chain for the merged profile
-        merged_data['inherits_from'] = []
+        Rule dictionaries are built fresh by layering parents from last to
+        first and this profile on top, so earlier parents override later
+        ones and the child overrides all of them. Only the free-form
+        custom rules and metadata of parents are deep copied, as they may
+        hold nested structures.
         
-        return RedactionProfile._from_dict(merged_data)
+        Args:
+            parents: Parent profiles in inheritance order
+            
+        Returns:
+            New merged profile with an empty inheritance chain
+        """
+        visual_rules: Dict[str, bool] = {}
+        text_rules: Dict[str, bool] = {}
+        custom_rules: Dict[str, Any] = {}
+        metadata: Dict[str, Any] = {}
+        languages = set()
+        
+        for parent in reversed(parents):
+            visual_rules.update(parent.visual_rules)
+            text_rules.update(parent.text_rules)
+            custom_rules.update(copy.deepcopy(parent.custom_rules))
+            metadata.update(copy.deepcopy(parent.metadata))
+            languages.update(parent.multilingual_support)
+        
+        visual_rules.update(self.visual_rules)
+        text_rules.update(self.text_rules)
+        custom_rules.update(self.custom_rules)
+        metadata.update(self.metadata)
+        languages.update(self.multilingual_support)
+        
+        return RedactionProfile(
+            name=self.name,
+            description=self.description,
+            visual_rules=visual_rules,
+            text_rules=text_rules,
+            redaction_style=self.redaction_style,
+            multilingual_support=list(languages),
+            confidence_threshold=self.confidence_threshold,
+            custom_rules=custom_rules,
+            inherits_from=[],
+            version=self.version,
+            metadata=metadata
+        )
     
     def detect_conflicts(self, other: 'RedactionProfile') -> List[str]:
         """
@@ -450,6 +524,11 @@ class ProfileManager:
         self.profile_directories = profile_directories or [Path("profiles")]
         self._profile_cache: Dict[str, RedactionProfile] = {}
         self._inheritance_graph: Dict[str, List[str]] = {}
+        self._graph_signature: Optional[Tuple[Tuple[str, int], ...]] = None
+        # Parsed YAML documents keyed by path, valid while st_mtime_ns matches
+        self._parse_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        # C3 resolution order per profile name, reset with the inheritance graph
+        self._mro_cache: Dict[str, List[str]] = {}
     
     def load_profile(self, name: str, resolve_inheritance: bool = True) -> RedactionProfile:
         """
@@ -478,7 +557,7 @@ class ProfileManager:
         
         # Load profile based on file extension
         if profile_path.suffix.lower() == '.yaml' or profile_path.suffix.lower() == '.yml':
-            profile = RedactionProfile.from_yaml(profile_path)
+            profile = RedactionProfile._from_dict(self._load_yaml_file(profile_path))
         elif profile_path.suffix.lower() == '.json':
             profile = RedactionProfile.from_json(profile_path)
         else:
@@ -489,27 +568,54 @@ class ProfileManager:
         self._profile_cache[raw_cache_key] = profile
         
         if resolve_inheritance and profile.inherits_from:
-            profile = self._resolve_inheritance(profile)
+            profile = self._resolve_inheritance(profile, name)
         
         # Cache resolved profile
         self._profile_cache[cache_key] = profile
         return profile
     
+    def _load_yaml_file(self, path: Path) -> Dict[str, Any]:
+        """
+        Parse a YAML profile file, reusing the cached parse while the file is unchanged.
+        
+        Args:
+            path: Path to YAML profile file
+            
+        Returns:
+            Deep copy of the parsed document, safe for the caller to mutate
+        """
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        cached = self._parse_cache.get(path)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            return copy.deepcopy(cached[1])
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f.read(), Loader=_YAML_LOADER) or {}
+        
+        if mtime is not None:
+            self._parse_cache[path] = (mtime, data)
+        return copy.deepcopy(data)
+    
     def _find_profile_file(self, name: str) -> Optional[Path]:
         """Find profile file in configured directories."""
         for directory in self.profile_directories:
-            for extension in ['.yaml', '.yml', '.json']:
+            for extension in _PROFILE_EXTENSIONS:
                 profile_path = directory / f"{name}{extension}"
                 if profile_path.exists():
                     return profile_path
         return None
     
-    def _resolve_inheritance(self, profile: RedactionProfile) -> RedactionProfile:
+    def _resolve_inheritance(self, profile: RedactionProfile, name: Optional[str] = None) -> RedactionProfile:
         """
         Resolve inheritance chain for a profile.
         
         Args:
             profile: Profile to resolve inheritance for
+            name: Name the profile was loaded under, defaults to profile.name
             
         Returns:
             Profile with inheritance resolved
@@ -521,31 +627,231 @@ class ProfileManager:
             return profile
         
         # Check for circular inheritance
-        visited = set()
-        self._check_circular_inheritance(profile.name, profile.inherits_from, visited)
+        self._detect_cycles(profile)
+        
+        # Layer raw ancestors along the resolution order in one pass
+        ancestors = [
+            self.load_profile(ancestor, resolve_inheritance=False)
+            for ancestor in self._linearize(name or profile.name, profile)[1:]
+        ]
+        return profile._merge_chain(ancestors)
+    
+    def _linearize(self, name: str, profile: RedactionProfile) -> List[str]:
+        """
+        Compute the C3 linearization of a profile's inheritance lattice.
         
-        # Load and merge parent profiles
-        resolved_profile = profile
-        for parent_name in profile.inherits_from:
-            parent_profile = self.load_profile(parent_name, resolve_inheritance=True)
-            resolved_profile = resolved_profile.merge_with_parent(parent_profile)
+        The order lists the profile first and each ancestor once, with every
+        profile ahead of its parents and parents kept in declaration order.
+        Entries are the lookup names used by inherits_from and load_profile
+        (file stems), not the profiles' `name` fields. Results are cached
+        per lookup name until the inheritance graph changes on disk.
         
-        return resolved_profile
+        Args:
+            name: Lookup name the profile was loaded under
+            profile: Raw profile to linearize, already checked for cycles
+            
+        Returns:
+            Profile names in resolution order, starting with the profile itself
+            
+        Raises:
+            ProfileValidationError: If no consistent resolution order exists
+        """
+        mro = self._mro_cache.get(name)
+        if mro is not None:
+            return mro
+        
+        sequences = [
+            self._linearize(parent, self.load_profile(parent, resolve_inheritance=False))
+            for parent in profile.inherits_from
+        ]
+        sequences.append(profile.inherits_from)
+        mro = [name] + _c3_merge(sequences)
+        
+        self._mro_cache[name] = mro
+        return mro
     
-    def _check_circular_inheritance(self, current: str, parents: List[str], visited: set):
-        """Check for circular inheritance in the profile chain."""
-        if current in visited:
-            raise ProfileValidationError(f"Circular inheritance detected involving profile '{current}'")
+    def _detect_cycles(self, profile: RedactionProfile) -> None:
+        """
+        Check every profile reachable from `profile` for circular inheritance.
+        
+        Runs an iterative Tarjan strongly-connected-components search over
+        the inheritance graph, so detection is O(V + E) and not bounded by
+        the recursion limit. Any component with more than one profile, or a
+        profile listing itself as a parent, is a cycle.
+        
+        Args:
+            profile: Profile whose inheritance chain should be checked
+            
+        Raises:
+            ProfileValidationError: If circular inheritance detected
+        """
+        graph = self._build_inheritance_graph()
+        
+        def parents_of(name: str) -> List[str]:
+            if name == profile.name:
+                return profile.inherits_from
+            return graph.get(name, [])
+        
+        index: Dict[str, int] = {profile.name: 0}
+        lowlink: Dict[str, int] = {profile.name: 0}
+        stack = [profile.name]
+        on_stack = {profile.name}
+        frames = [(profile.name, iter(parents_of(profile.name)))]
+        
+        while frames:
+            node, children = frames[-1]
+            for child in children:
+                if child not in index:
+                    if child != profile.name and child not in graph:
+                        logger.warning(f"Parent profile '{child}' not found for '{node}'")
+                        continue
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    frames.append((child, iter(parents_of(child))))
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            else:
+                frames.pop()
+                if frames:
+                    caller = frames[-1][0]
+                    lowlink[caller] = min(lowlink[caller], lowlink[node])
+                
+                if lowlink[node] != index[node]:
+                    continue
+                
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                
+                if len(component) > 1 or node in parents_of(node):
+                    cycle = sorted(component, key=index.__getitem__)
+                    cycle.append(cycle[0])
+                    raise ProfileValidationError(f"Circular inheritance detected: {' -> '.join(cycle)}")
+    
+    def _build_inheritance_graph(self) -> Dict[str, List[str]]:
+        """
+        Build the profile name -> parent names graph for all profiles on disk.
+        
+        Only YAML headers are read where possible. The graph is reused until
+        a profile file is added, removed or modified.
         
-        visited.add(current)
+        Returns:
+            Mapping of profile name to the names it inherits from
+        """
+        profile_files: Dict[str, Tuple[Path, int]] = {}
+        for directory in self.profile_directories:
+            if not directory.is_dir():
+                continue
+            
+            found: Dict[str, Tuple[int, Path, int]] = {}
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    for rank, extension in enumerate(_PROFILE_EXTENSIONS):
+                        if entry.name.endswith(extension) and entry.is_file():
+                            stem = entry.name[:-len(extension)]
+                            if stem not in found or rank < found[stem][0]:
+                                found[stem] = (rank, Path(entry.path), entry.stat().st_mtime_ns)
+                            break
+            
+            # Earlier directories take precedence, matching _find_profile_file
+            for stem, (_, path, mtime) in found.items():
+                profile_files.setdefault(stem, (path, mtime))
         
-        for parent_name in parents:
+        signature = tuple(sorted((str(path), mtime) for path, mtime in profile_files.values()))
+        if signature == self._graph_signature:
+            return self._inheritance_graph
+        
+        graph = {}
+        for stem, (path, _) in profile_files.items():
             try:
-                parent_profile = self.load_profile(parent_name, resolve_inheritance=False)
-                if parent_profile.inherits_from:
-                    self._check_circular_inheritance(parent_name, parent_profile.inherits_from, visited.copy())
-            except FileNotFoundError:
-                logger.warning(f"Parent profile '{parent_name}' not found for '{current}'")
+                graph[stem] = self._read_parent_names(path)
+            except (OSError, ValueError, yaml.YAMLError) as e:
+                logger.warning(f"Could not read inheritance for profile '{stem}': {e}")
+                graph[stem] = []
+        
+        self._inheritance_graph = graph
+        self._graph_signature = signature
+        self._mro_cache.clear()
+        return graph
+    
+    def _read_parent_names(self, path: Path) -> List[str]:
+        """Read the parent names of a profile file, peeking at YAML headers first."""
+        if path.suffix.lower() in ('.yaml', '.yml'):
+            header = self._load_header(path)
+            if header is not None:
+                return header['inherits_from']
+            data = self._load_yaml_file(path)
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        
+        inherits_from = data.get('inherits_from') if isinstance(data, dict) else None
+        if not isinstance(inherits_from, list):
+            return []
+        return [parent for parent in inherits_from if isinstance(parent, str)]
+    
+    @staticmethod
+    def _load_header(path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Parse only the `name` and `inherits_from` keys from a YAML profile header.
+        
+        Args:
+            path: Path to YAML profile file
+            
+        Returns:
+            Dictionary with 'name' and 'inherits_from', or None if the header
+            is malformed, the keys are not within the first lines of the file,
+            or `inherits_from` appears in a form the header pattern misses
+        """
+        lines = []
+        truncated = False
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if len(lines) == _HEADER_LINES:
+                    truncated = True
+                    break
+                lines.append(line)
+        
+        # Grow each matched key into its own YAML fragment, pulling in the
+        # indented/sequence lines of a block-style value
+        fragments = []
+        for index, line in enumerate(lines):
+            if not _HEADER_RE.match(line):
+                continue
+            fragment = [line]
+            for follow in lines[index + 1:]:
+                if follow.strip() and not follow[0].isspace() and not follow.startswith('-'):
+                    break
+                fragment.append(follow)
+            else:
+                if truncated:
+                    # Value may continue past the header window
+                    return None
+            fragments.append(''.join(fragment))
+        
+        try:
+            header = yaml.load(''.join(fragments), Loader=_YAML_LOADER) or {}
+        except yaml.YAMLError:
+            return None
+        
+        if 'inherits_from' not in header and (
+            truncated or any('inherits_from' in line for line in lines)
+        ):
+            # Key is past the header window or written in a form the
+            # pattern does not match, e.g. "inherits_from : [...]"
+            return None
+        
+        inherits_from = header.get('inherits_from') or []
+        if not isinstance(inherits_from, list) or not all(isinstance(p, str) for p in inherits_from):
+            return None
+        
+        return {'name': header.get('name', path.stem), 'inherits_from': inherits_from}
     
     def list_profiles(self) -> List[str]:
         """
@@ -662,9 +968,12 @@ class ProfileManager:
         cache_keys = [k for k in self._profile_cache.keys() if k.startswith(profile.name)]
         for key in cache_keys:
             del self._profile_cache[key]
+        self._mro_cache.clear()
         
         return file_path
     
     def clear_cache(self):
         """Clear the profile cache."""
-        self._profile_cache.clear()
\ No newline at end of file
+        self._profile_cache.clear()
+        self._parse_cache.clear()
+        self._mro_cache.clear()
\ No newline at end of file
@@ -6,7 +6,7 @@ import os
 import shutil
 import tempfile
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Optional, Set, Union
 import logging
 from contextlib import contextmanager
 
@@ -120,8 +120,8 @@ class TempFileManager:
     
     def __init__(self, base_dir: Optional[Union[str, Path]] = None):
         self.base_dir = Path(base_dir) if base_dir else None
-        self.temp_files: List[Path] = []
-        self.temp_dirs: List[Path] = []
+        self.temp_files: Set[Path] = set()
+        self.temp_dirs: Set[Path] = set()
         self.logger = logging.getLogger(__name__)
     
     def create_temp_file(self, suffix: str = '', prefix: str = 'gopnik_') -> Path:
@@ -143,7 +143,7 @@ class TempFileManager:
         os.close(fd)  # Close file descriptor, keep file
         
         temp_file = Path(temp_path)
-        self.temp_files.append(temp_file)
+        self.temp_files.add(temp_file)
         return temp_file
     
     def create_temp_dir(self, prefix: str = 'gopnik_') -> Path:
@@ -157,7 +157,7 @@ class TempFileManager:
             Path to temporary directory
         """
         temp_dir = Path(tempfile.mkdtemp(prefix=prefix, dir=self.base_dir))
-        self.temp_dirs.append(temp_dir)
+        self.temp_dirs.add(temp_dir)
         return temp_dir
     
     @contextmanager
@@ -198,18 +198,17 @@ class TempFileManager:
     def cleanup_all(self) -> None:
         """Clean up all temporary files and directories."""
         # Clean up files
-        for temp_file in self.temp_files[:]:
+        for temp_file in list(self.temp_files):
             self._cleanup_file(temp_file)
         
         # Clean up directories
-        for temp_dir in self.temp_dirs[:]:
+        for temp_dir in list(self.temp_dirs):
             self._cleanup_dir(temp_dir)
     
     def _cleanup_file(self, file_path: Path) -> None:
         """Securely clean up a temporary file."""
         try:
-            if file_path in self.temp_files:
-                self.temp_files.remove(file_path)
+            self.temp_files.discard(file_path)
             
             if file_path.exists():
                 FileUtils.secure_delete(file_path)
@@ -220,8 +219,7 @@ class TempFileManager:
     def _cleanup_dir(self, dir_path: Path) -> None:
         """Clean up a temporary directory."""
         try:
-            if dir_path in self.temp_dirs:
-                self.temp_dirs.remove(dir_path)
+            self.temp_dirs.discard(dir_path)
             
             if dir_path.exists():
                 shutil.rmtree(dir_path)
@@ -8,7 +8,7 @@ import os
 import sys
 import threading
 import weakref
-from typing import Any, Dict, List, Optional, Set, Union, Callable
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
 import logging
 import ctypes
 from ctypes import c_void_p, c_size_t
@@ -195,9 +195,9 @@ class SecureMemoryManager:
                         self.clear_sensitive_data(value)
                 obj.clear()
                 
-            elif hasattr(obj, '__dict__'):
-                # Clear object attributes
-                for attr_name, attr_value in list(obj.__dict__.items()):
+            elif hasattr(obj, '__dict__') or hasattr(type(obj), '__slots__'):
+                # Clear object attributes, including slotted ones
+                for attr_name, attr_value in self._object_attributes(obj):
                     if isinstance(attr_value, (str, bytes, bytearray)):
                         self.clear_sensitive_data(attr_value)
                         setattr(obj, attr_name, None)
@@ -213,6 +213,24 @@ class SecureMemoryManager:
             self.logger.error(f"Failed to clear sensitive data: {e}")
             return False
     
+    @staticmethod
+    def _object_attributes(obj: Any) -> List[Tuple[str, Any]]:
+        """Collect an object's instance attributes from __dict__ and __slots__."""
+        attributes = list(getattr(obj, '__dict__', {}).items())
+        for cls in type(obj).__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for slot in slots:
+                if slot in ('__dict__', '__weakref__'):
+                    continue
+                try:
+                    attributes.append((slot, getattr(obj, slot)))
+                except AttributeError:
+                    # Slot never assigned
+                    continue
+        return attributes
+    
     def force_garbage_collection(self, generations: Optional[List[int]] = None) -> Dict[str, int]:
         """
         Force garbage collection with optional generation specification.
@@ -2,25 +2,218 @@
 Secure temporary file handling with encryption and access controls.
 """
 
+import ctypes
+import mmap
 import os
 import stat
+import sys
 import tempfile
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Union, BinaryIO
+from typing import Dict, List, Optional, Set, Union, BinaryIO
 from contextlib import contextmanager
 import logging
 import weakref
 import atexit
 
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import secrets
 import base64
 
 from .crypto import CryptographicUtils
 
+# Optional Rust-backed Fernet implementation
+try:
+    import rfernet
+    HAS_RFERNET = True
+except ImportError:
+    rfernet = None
+    HAS_RFERNET = False
+
+
+class _RFernet:
+    """
+    rfernet cipher behind the cryptography Fernet interface.
+    
+    rfernet takes and returns tokens as str and raises its own
+    DecryptionError; this keeps tokens as bytes and raises InvalidToken.
+    """
+    
+    __slots__ = ('_fernet',)
+    
+    def __init__(self, key: bytes):
+        self._fernet = rfernet.Fernet(key.decode('ascii'))
+    
+    def encrypt(self, data: bytes) -> bytes:
+        return self._fernet.encrypt(data).encode('ascii')
+    
+    def decrypt(self, token: bytes) -> bytes:
+        try:
+            return self._fernet.decrypt(token.decode('ascii'))
+        except (rfernet.DecryptionError, UnicodeDecodeError) as e:
+            raise InvalidToken from e
+
+
+class _IVPool:
+    """
+    Buffered CSPRNG output handed out as 16-byte Fernet IVs.
+    
+    One secrets.token_bytes call fills the pool for 256 IVs instead of one
+    os.urandom call per encryption. The pool is refilled when exhausted and
+    discarded in a forked child so parent and child never share IVs.
+    """
+    
+    IV_SIZE = 16
+    POOL_SIZE = 4096
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool = b''
+        self._offset = 0
+        self._pid = None
+    
+    def take(self) -> bytes:
+        with self._lock:
+            pid = os.getpid()
+            if self._pid != pid or self._offset + self.IV_SIZE > len(self._pool):
+                self._pool = secrets.token_bytes(self.POOL_SIZE)
+                self._offset = 0
+                self._pid = pid
+            
+            iv = self._pool[self._offset:self._offset + self.IV_SIZE]
+            self._offset += self.IV_SIZE
+            return iv
+
+
+_iv_pool = _IVPool()
+
+
+class _PooledFernet(Fernet):
+    """Fernet cipher drawing its IVs from the shared pool."""
+    
+    def encrypt_at_time(self, data: bytes, current_time: int) -> bytes:
+        return self._encrypt_from_parts(data, current_time, _iv_pool.take())
+
+
+def _create_fernet(key: bytes):
+    """
+    Create a Fernet cipher for a key, preferring rfernet when installed.
+    
+    All implementations produce standard Fernet tokens, so files written
+    with one can be read with the others. rfernet generates its own IVs;
+    the pooled IVs are used only with cryptography versions that expose
+    Fernet._encrypt_from_parts.
+    """
+    if HAS_RFERNET:
+        return _RFernet(key)
+    if hasattr(Fernet, '_encrypt_from_parts'):
+        return _PooledFernet(key)
+    return Fernet(key)
+
+
+# fallocate(2) flags that release a file's blocks without changing its size
+_FALLOC_FL_KEEP_SIZE = 0x01
+_FALLOC_FL_PUNCH_HOLE = 0x02
+_fallocate = None
+
+
+def _punch_hole(fd: int, size: int) -> bool:
+    """
+    Release every data block of an open file with fallocate(2) PUNCH_HOLE.
+    
+    Args:
+        fd: File descriptor opened for writing
+        size: Number of bytes from the start of the file to release
+        
+    Returns:
+        True if the blocks were released, False if unsupported here
+    """
+    global _fallocate
+    if not sys.platform.startswith('linux'):
+        return False
+    
+    if _fallocate is None:
+        try:
+            _fallocate = ctypes.CDLL(None, use_errno=True).fallocate
+        except (OSError, AttributeError):
+            _fallocate = False
+            return False
+        _fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+        _fallocate.restype = ctypes.c_int
+    elif _fallocate is False:
+        return False
+    
+    return _fallocate(fd, _FALLOC_FL_PUNCH_HOLE | _FALLOC_FL_KEEP_SIZE, 0, size) == 0
+
+
+# Overwrite passes are generated and copied into the file in chunks of this size
+_OVERWRITE_CHUNK = 1 << 20
+
+
+def _pass_chunks(size: int, value: Optional[int]):
+    """
+    Yield (offset, data) chunks covering one overwrite pass.
+    
+    Args:
+        size: Number of bytes to cover
+        value: Byte value to fill with, or None for CSPRNG output
+    """
+    if value is None:
+        # AES-256-CTR keystream under a fresh random key: CSPRNG-quality
+        # output generated in user space instead of one getrandom per chunk
+        keystream = Cipher(
+            algorithms.AES(secrets.token_bytes(32)), modes.CTR(secrets.token_bytes(16))
+        ).encryptor()
+        fill = memoryview(bytes(min(size, _OVERWRITE_CHUNK)))
+    else:
+        keystream = None
+        fill = memoryview(bytes([value]) * min(size, _OVERWRITE_CHUNK))
+    
+    for offset in range(0, size, _OVERWRITE_CHUNK):
+        length = min(_OVERWRITE_CHUNK, size - offset)
+        yield offset, fill[:length] if keystream is None else keystream.update(fill[:length])
+
+
+def _fill_mapping(mapping: mmap.mmap, value: Optional[int]) -> None:
+    """
+    Overwrite a whole file mapping in place, one chunk at a time.
+    
+    Args:
+        mapping: Writable mapping of the file
+        value: Byte value to fill with, or None for CSPRNG output
+    """
+    for offset, chunk in _pass_chunks(len(mapping), value):
+        mapping[offset:offset + len(chunk)] = chunk
+
+
+def _fill_descriptor(fd: int, size: int, value: Optional[int]) -> None:
+    """
+    Overwrite the first `size` bytes of an open file, one chunk at a time.
+    
+    Used where the file cannot be memory-mapped.
+    
+    Args:
+        fd: File descriptor opened for writing
+        size: Number of bytes to overwrite
+        value: Byte value to fill with, or None for CSPRNG output
+    """
+    if not hasattr(os, 'pwrite'):
+        # Windows has no pwrite
+        os.lseek(fd, 0, os.SEEK_SET)
+    
+    for offset, chunk in _pass_chunks(size, value):
+        view = memoryview(chunk)
+        while view:
+            if hasattr(os, 'pwrite'):
+                written = os.pwrite(fd, view, offset)
+            else:
+                written = os.write(fd, view)
+            view = view[written:]
+            offset += written
+
 
 class SecureFileManager:
     """
@@ -46,8 +239,8 @@ class SecureFileManager:
             encryption_key: Optional encryption key (generated if not provided)
         """
         self.base_dir = Path(base_dir) if base_dir else None
-        self.temp_files: List[Path] = []
-        self.temp_dirs: List[Path] = []
+        self.temp_files: Set[Path] = set()
+        self.temp_dirs: Set[Path] = set()
         self.encrypted_files: Dict[Path, bytes] = {}  # Maps file path to encryption key
         self.logger = logging.getLogger(__name__)
         
@@ -57,7 +250,9 @@ class SecureFileManager:
         else:
             self._encryption_key = Fernet.generate_key()
         
-        self._fernet = Fernet(self._encryption_key)
+        # One cipher per key, built once; files on the default key use _fernet
+        self._fernet = _create_fernet(self._encryption_key)
+        self._file_ciphers: Dict[bytes, object] = {}
         self._crypto_utils = CryptographicUtils()
         
         # Register for cleanup on exit
@@ -124,7 +319,7 @@ class SecureFileManager:
             os.close(fd)
             
             # Track the file
-            self.temp_files.append(temp_file)
+            self.temp_files.add(temp_file)
             
             # Store encryption info if encrypted
             if encrypted:
@@ -162,7 +357,7 @@ class SecureFileManager:
             os.chmod(temp_dir, mode)
             
             # Track the directory
-            self.temp_dirs.append(temp_dir)
+            self.temp_dirs.add(temp_dir)
             
             self.logger.debug(f"Created secure temp dir: {temp_dir}")
             return temp_dir
@@ -182,12 +377,13 @@ class SecureFileManager:
         
         Args:
             file_path: Path to file
-            data: Data to encrypt and write
+            data: Data to encrypt and write; bytes are encrypted as given,
+                str is encoded as UTF-8 first
         """
         if isinstance(data, str):
             data = data.encode('utf-8')
         
-        encrypted_data = self._fernet.encrypt(data)
+        encrypted_data = self._fernet_for(file_path).encrypt(data)
         
         with open(file_path, 'wb') as f:
             f.write(encrypted_data)
@@ -210,11 +406,30 @@ class SecureFileManager:
         with open(file_path, 'rb') as f:
             encrypted_data = f.read()
         
-        decrypted_data = self._fernet.decrypt(encrypted_data)
+        decrypted_data = self._fernet_for(file_path).decrypt(encrypted_data)
         
         self.logger.debug(f"Read encrypted data from: {file_path}")
         return decrypted_data
     
+    def _fernet_for(self, file_path: Path):
+        """
+        Get the cipher for a file's recorded key, building it at most once per key.
+        
+        Args:
+            file_path: Path to encrypted file
+            
+        Returns:
+            Fernet cipher for the file
+        """
+        key = self.encrypted_files.get(file_path, self._encryption_key)
+        if key == self._encryption_key:
+            return self._fernet
+        
+        cipher = self._file_ciphers.get(key)
+        if cipher is None:
+            cipher = self._file_ciphers[key] = _create_fernet(key)
+        return cipher
+    
     @contextmanager
     def secure_temp_file(self, suffix: str = '', prefix: str = 'gopnik_secure_',
                         encrypted: bool = True, mode: int = 0o600):
@@ -256,13 +471,21 @@ class SecureFileManager:
         finally:
             self._secure_cleanup_dir(temp_dir)
     
-    def secure_delete_file(self, file_path: Path, passes: int = 2) -> bool:
+    def secure_delete_file(self, file_path: Path, passes: int = 2, discard: bool = False) -> bool:
         """
         Securely delete a file with multiple overwrite passes.
         
+        Callers on SSD-backed storage can opt in to `discard`: where the
+        filesystem supports it, the file's blocks are then released with a
+        single fallocate PUNCH_HOLE instead of being overwritten. This skips
+        the overwrite passes entirely, so it gives no guarantee that the old
+        contents are gone from the medium and is off by default.
+        
         Args:
             file_path: Path to file to delete
-            passes: Number of overwrite passes (default: 3)
+            passes: Number of overwrite passes (default: 2)
+            discard: Release blocks instead of overwriting where supported
+                (default: False)
             
         Returns:
             True if deletion was successful
@@ -273,23 +496,45 @@ class SecureFileManager:
         try:
             file_size = file_path.stat().st_size
             
-            # Multiple overwrite passes with different patterns
-            with open(file_path, 'r+b') as f:
-                for pass_num in range(passes):
-                    f.seek(0)
-                    
-                    if pass_num == 0:
-                        # First pass: random data
-                        f.write(secrets.token_bytes(file_size))
-                    elif pass_num == 1:
-                        # Second pass: all zeros
-                        f.write(b'\x00' * file_size)
-                    else:
-                        # Final pass: all ones
-                        f.write(b'\xFF' * file_size)
+            fd = os.open(file_path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+            try:
+                if discard and file_size and _punch_hole(fd, file_size):
+                    os.fsync(fd)
+                    passes = 0
+                
+                # Multiple overwrite passes with different patterns, written
+                # straight into the page cache through one mapping where the
+                # file can be mapped, and with positional writes otherwise
+                if passes and file_size:
+                    try:
+                        mapping = mmap.mmap(fd, file_size)
+                    except (OSError, ValueError):
+                        mapping = None
                     
-                    f.flush()
-                    os.fsync(f.fileno())
+                    try:
+                        for pass_num in range(passes):
+                            if pass_num == 0:
+                                # First pass: random data
+                                value = None
+                            elif pass_num == 1:
+                                # Second pass: all zeros
+                                value = 0x00
+                            else:
+                                # Final pass: all ones
+                                value = 0xFF
+                            
+                            # Synchronously write each pass back to disk
+                            if mapping is not None:
+                                _fill_mapping(mapping, value)
+                                mapping.flush()
+                            else:
+                                _fill_descriptor(fd, file_size, value)
+                                os.fsync(fd)
+                    finally:
+                        if mapping is not None:
+                            mapping.close()
+            finally:
+                os.close(fd)
             
             # Remove the file
             file_path.unlink()
@@ -341,26 +586,24 @@ class SecureFileManager:
     def cleanup_all(self) -> None:
         """Clean up all temporary files and directories."""
         # Clean up files
-        for temp_file in self.temp_files[:]:
+        for temp_file in list(self.temp_files):
             self._secure_cleanup_file(temp_file)
         
         # Clean up directories
-        for temp_dir in self.temp_dirs[:]:
+        for temp_dir in list(self.temp_dirs):
             self._secure_cleanup_dir(temp_dir)
         
         # Clear encryption keys from memory
         self.encrypted_files.clear()
+        self._file_ciphers.clear()
         
         self.logger.debug("Completed cleanup of all temporary files and directories")
     
     def _secure_cleanup_file(self, file_path: Path) -> None:
         """Securely clean up a temporary file."""
         try:
-            if file_path in self.temp_files:
-                self.temp_files.remove(file_path)
-            
-            if file_path in self.encrypted_files:
-                self.encrypted_files.pop(file_path, None)
+            self.temp_files.discard(file_path)
+            self.encrypted_files.pop(file_path, None)
             
             if file_path.exists():
                 self.secure_delete_file(file_path)
@@ -371,22 +614,31 @@ class SecureFileManager:
     def _secure_cleanup_dir(self, dir_path: Path) -> None:
         """Securely clean up a temporary directory."""
         try:
-            if dir_path in self.temp_dirs:
-                self.temp_dirs.remove(dir_path)
+            self.temp_dirs.discard(dir_path)
             
             if dir_path.exists():
-                # Securely delete all files in directory first
-                for file_path in dir_path.rglob('*'):
-                    if file_path.is_file():
-                        self.secure_delete_file(file_path)
-                
-                # Remove directory structure
-                import shutil
-                shutil.rmtree(dir_path)
+                self._remove_tree(dir_path)
                 
         except Exception as e:
             self.logger.error(f"Failed to cleanup temp dir {dir_path}: {e}")
     
+    def _remove_tree(self, dir_path: Union[str, Path]) -> None:
+        """
+        Securely delete every file under a directory and remove it, in one walk.
+        
+        Symlinks are unlinked without touching their targets.
+        """
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    self._remove_tree(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    self.secure_delete_file(Path(entry.path))
+                else:
+                    os.unlink(entry.path)
+        
+        os.rmdir(dir_path)
+    
     def get_encryption_key(self) -> bytes:
         """
         Get the encryption key for this manager.
@@ -422,7 +674,7 @@ class SecureFileHandle:
         self.file_path = file_path
         self.mode = mode
         self._file_handle: Optional[BinaryIO] = None
-        self._fernet = Fernet(encryption_key) if encryption_key else None
+        self._fernet = _create_fernet(encryption_key) if encryption_key else None
         self.logger = logging.getLogger(__name__)
     
     def __enter__(self):
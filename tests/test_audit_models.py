@@ -92,6 +92,21 @@ class TestAuditLog:
         assert audit_log.level == AuditLevel.INFO  # Default level
         assert len(audit_log.id) > 0
     
+    def test_slotted_instances(self):
+        """Test audit logs are slotted and still pickle."""
+        import pickle
+        
+        audit_log = AuditLog(
+            operation=AuditOperation.DOCUMENT_UPLOAD,
+            timestamp=datetime.now(timezone.utc),
+            document_id="doc_123"
+        )
+        
+        assert not hasattr(audit_log, '__dict__')
+        with pytest.raises(AttributeError):
+            audit_log.unexpected = True
+        assert pickle.loads(pickle.dumps(audit_log)) == audit_log
+    
     def test_timestamp_utc_conversion(self):
         """Test automatic UTC conversion of timestamps."""
         # Create timestamp without timezone
@@ -370,6 +385,26 @@ class TestAuditLog:
         restored_from_json = AuditLog.from_json(json_str)
         assert restored_from_json.id == audit_log.id
     
+    def test_json_backends_agree(self):
+        """Test orjson and json module output decode to the same data."""
+        audit_log = AuditLog(
+            operation=AuditOperation.DOCUMENT_REDACTION,
+            timestamp=datetime.now(timezone.utc),
+            document_id="doc_ü",
+            details={"pages": 3, 7: "int key"}
+        )
+        
+        with patch('src.gopnik.models.pii.HAS_ORJSON', False):
+            plain = audit_log.to_json()
+        fast = audit_log.to_json()
+        
+        assert json.loads(fast) == json.loads(plain)
+        assert AuditLog.from_json(fast).document_id == "doc_ü"
+        
+        # Values orjson rejects fall back to the json module
+        audit_log.details["huge"] = 1 << 70
+        assert json.loads(audit_log.to_json())["details"]["huge"] == 1 << 70
+    
     def test_csv_export(self):
         """Test CSV export functionality."""
         audit_log = AuditLog(
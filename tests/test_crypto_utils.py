@@ -6,6 +6,7 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 from src.gopnik.utils.crypto import CryptographicUtils
 
@@ -205,6 +206,35 @@ class TestCryptographicUtils:
         is_valid2 = self.crypto.verify_signature_ecdsa(test_data, signature2)
         assert is_valid2 is True
     
+    def test_ed25519_signing_and_key_loading(self):
+        """Test Ed25519 signatures across generated and loaded keys."""
+        private_pem, public_pem = self.crypto.generate_ed25519_key_pair()
+        
+        assert b"BEGIN PRIVATE KEY" in private_pem
+        assert b"BEGIN PUBLIC KEY" in public_pem
+        
+        test_data = "This is test data for Ed25519 signing"
+        signature = self.crypto.sign_data_ed25519(test_data)
+        
+        assert self.crypto.verify_signature_ed25519(test_data, signature) is True
+        assert self.crypto.verify_signature_ed25519("Modified data", signature) is False
+        assert self.crypto.verify_signature_ed25519(test_data, "invalid_signature") is False
+        
+        # Keys loaded from PEM verify signatures made with the originals
+        crypto2 = CryptographicUtils()
+        crypto2.load_ed25519_private_key(private_pem.decode())
+        crypto2.load_ed25519_public_key(public_pem)
+        
+        assert crypto2.verify_signature_ed25519(test_data, signature) is True
+        assert self.crypto.verify_signature_ed25519(b"bytes data", crypto2.sign_data_ed25519(b"bytes data")) is True
+        
+        # Without keys, Ed25519 operations fail clearly
+        crypto3 = CryptographicUtils()
+        with pytest.raises(ValueError, match="Ed25519 private key not loaded"):
+            crypto3.sign_data_ed25519(test_data)
+        with pytest.raises(ValueError, match="Ed25519 public key not loaded"):
+            crypto3.verify_signature_ed25519(test_data, signature)
+    
     def test_legacy_methods(self):
         """Test legacy signing methods for backward compatibility."""
         # Generate RSA key pair for legacy methods
@@ -273,6 +303,54 @@ class TestCryptographicUtils:
         finally:
             os.unlink(temp_file_path)
     
+    def test_large_file_hashing_without_mmap(self):
+        """Test SHA-256 hashing falls back to chunked reads when a file cannot be mapped."""
+        large_content = os.urandom(3 * 1024 * 1024 + 17)
+        
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(large_content)
+            temp_file_path = Path(temp_file.name)
+        
+        try:
+            with patch('src.gopnik.utils.crypto.mmap.mmap', side_effect=OSError("no mmap")):
+                result = self.crypto.generate_sha256_hash(temp_file_path)
+            
+            assert result == self.crypto.generate_sha256_hash_from_bytes(large_content)
+        finally:
+            os.unlink(temp_file_path)
+    
+    def test_generate_sha256_hashes(self):
+        """Test hashing several files returns hashes in order, on and off the thread pool."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            small_contents = [f"small file {i}".encode() for i in range(3)]
+            large_contents = [os.urandom(2 * 1024 * 1024 + i) for i in range(3)]
+            
+            for name, contents in (("small", small_contents), ("large", large_contents)):
+                paths = []
+                for i, content in enumerate(contents):
+                    path = Path(temp_dir) / f"{name}_{i}.bin"
+                    path.write_bytes(content)
+                    paths.append(path)
+                
+                expected = [self.crypto.generate_sha256_hash_from_bytes(content) for content in contents]
+                assert self.crypto.generate_sha256_hashes(paths) == expected
+            
+            assert self.crypto.generate_sha256_hashes([]) == []
+    
+    def test_hash_and_copy(self):
+        """Test copying a file returns the hash of its contents."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for size in (0, 100, 3 * 1024 * 1024 + 5):
+                content = os.urandom(size)
+                source = Path(temp_dir) / "source.bin"
+                destination = Path(temp_dir) / "copy.bin"
+                source.write_bytes(content)
+                
+                result = self.crypto.hash_and_copy(source, destination)
+                
+                assert destination.read_bytes() == content
+                assert result == self.crypto.generate_sha256_hash(source)
+    
     def test_signature_determinism(self):
         """Test that signatures are different for the same data (due to randomness in padding)."""
         self.crypto.generate_rsa_key_pair()
@@ -8,6 +8,8 @@ from unittest.mock import Mock, patch, MagicMock
 from PIL import Image
 import tempfile
 import os
+import subprocess
+import sys
 
 from src.gopnik.core.analyzer import DocumentAnalyzer
 from src.gopnik.models.processing import Document, DocumentFormat, PageInfo
@@ -400,6 +402,23 @@ class TestDocumentAnalyzer:
         assert page_data['width'] == 400
         assert page_data['height'] == 300
         assert page_data['area'] == 120000
+    
+    def test_package_import_defers_document_libraries(self):
+        """Test importing the package does not load PyMuPDF or Pillow."""
+        code = (
+            "import sys, src.gopnik; "
+            "print(sorted(m for m in ('fitz', 'PIL.Image') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True,
+            cwd=Path(__file__).resolve().parent.parent, check=True
+        )
+        assert result.stdout.strip() == '[]'
+        
+        from src.gopnik.core import analyzer
+        import fitz
+        assert analyzer.fitz is fitz
+        assert analyzer.Image is Image
 
 
 if __name__ == '__main__':
@@ -13,6 +13,7 @@ import pytest
 from src.gopnik.utils.memory_protection import (
     SecureMemoryManager, SecureString, MemoryProfiler
 )
+from src.gopnik.models.pii import PIIDetection, PIIType, BoundingBox
 
 
 class TestSecureMemoryManager:
@@ -128,6 +129,22 @@ class TestSecureMemoryManager:
         assert obj.data is None
         assert obj.normal == 42  # Non-sensitive data unchanged
     
+    def test_clear_sensitive_data_slotted_detection(self):
+        """Test clearing sensitive text from a slotted PIIDetection."""
+        detection = PIIDetection(
+            type=PIIType.NAME,
+            bounding_box=BoundingBox(0, 0, 10, 10),
+            confidence=0.9,
+            text_content="John Doe"
+        )
+        assert not hasattr(detection, '__dict__')
+        
+        result = self.manager.clear_sensitive_data(detection)
+        
+        assert result is True
+        assert detection.text_content is None
+        assert detection.confidence == 0.9
+    
     def test_force_garbage_collection(self):
         """Test forced garbage collection."""
         # Create some objects to collect
@@ -354,6 +354,23 @@ class TestPIIDetection:
         detection = PIIDetection.from_dict(legacy_data)
         assert detection.coordinates == (10, 20, 100, 200)
         assert detection.bounding_box.to_tuple() == (10, 20, 100, 200)
+    
+    def test_slotted_instances(self):
+        """Test detections and boxes are slotted and still pickle."""
+        import pickle
+        
+        detection = PIIDetection(
+            type=PIIType.NAME,
+            bounding_box=BoundingBox(1, 2, 3, 4),
+            confidence=0.8,
+            text_content="John Doe"
+        )
+        
+        assert not hasattr(detection, '__dict__')
+        assert not hasattr(detection.bounding_box, '__dict__')
+        with pytest.raises(AttributeError):
+            detection.unexpected = True
+        assert pickle.loads(pickle.dumps(detection)) == detection
 
 
 class TestPIIDetectionCollection:
@@ -552,6 +569,21 @@ class TestPIIDetectionCollection:
         assert restored.document_id == collection.document_id
         assert restored.total_pages == collection.total_pages
         assert restored.processing_metadata == collection.processing_metadata
+    
+    def test_json_without_orjson(self):
+        """Test JSON round trips match with and without orjson."""
+        collection = PIIDetectionCollection(
+            detections=self.create_sample_detections(),
+            processing_metadata={"ratio": float("nan"), "huge": 1 << 70}
+        )
+        
+        with patch('src.gopnik.models.pii.HAS_ORJSON', False):
+            plain = collection.to_json()
+            restored_plain = PIIDetectionCollection.from_json(plain)
+        restored = PIIDetectionCollection.from_json(collection.to_json())
+        
+        assert restored.to_dict()['detections'] == restored_plain.to_dict()['detections']
+        assert restored.processing_metadata["huge"] == 1 << 70
 
 
 class TestUtilityFunctions:
@@ -579,6 +611,9 @@ class TestUtilityFunctions:
         assert validate_coordinates((100, 20, 10, 200)) is False  # x1 >= x2
         assert validate_coordinates((-10, 20, 100, 200)) is False  # Negative
         assert validate_coordinates("invalid") is False  # Wrong type
+        assert validate_coordinates((10, 20, 100)) is False  # Too few values
+        assert validate_coordinates((10, 200, 100, 20)) is False  # y1 >= y2
+        assert validate_coordinates((10, "20", 100, 200)) is False  # Non-numeric
     
     def test_merge_overlapping_detections(self):
         """Test merging overlapping detections function."""
@@ -3,6 +3,7 @@ Unit tests for redaction profile models and parsing.
 """
 
 import pytest
+import os
 import tempfile
 import json
 import yaml
@@ -17,6 +18,37 @@ from src.gopnik.models.profiles import (
     ProfileConflictError
 )
 
+# Pre-serialized fixture profiles, written with write_text instead of yaml.dump
+MULTI_INHERITANCE_PROFILES = {
+    'parent1': (
+        "name: parent1\n"
+        "description: Parent 1\n"
+        "visual_rules:\n  face: true\n"
+        "text_rules:\n  email: true\n"
+        "multilingual_support:\n- en\n"
+    ),
+    'parent2': (
+        "name: parent2\n"
+        "description: Parent 2\n"
+        "visual_rules:\n  signature: true\n"
+        "text_rules:\n  phone: true\n"
+        "multilingual_support:\n- es\n"
+    ),
+    'multi_child': (
+        "name: multi_child\n"
+        "description: Multi-inheritance child\n"
+        "inherits_from:\n- parent1\n- parent2\n"
+        "visual_rules:\n  barcode: true\n"
+    ),
+}
+
+DIAMOND_PROFILES = {
+    'base': "name: base\ndescription: Base\nvisual_rules:\n  face: false\n",
+    'left': "name: left\ndescription: Left\ninherits_from:\n- base\nvisual_rules:\n  face: true\n",
+    'right': "name: right\ndescription: Right\ninherits_from:\n- base\ntext_rules:\n  email: true\n",
+    'diamond': "name: diamond\ndescription: Diamond\ninherits_from:\n- left\n- right\n",
+}
+
 
 class TestRedactionProfile:
     """Test cases for RedactionProfile class."""
@@ -312,6 +344,37 @@ class TestRedactionProfile:
         # Check inheritance is cleared
         assert merged.inherits_from == []
     
+    def test_merge_chain_precedence(self):
+        """Test earlier parents override later ones and the child overrides all."""
+        parent1 = RedactionProfile(
+            name="parent1",
+            description="Parent 1",
+            visual_rules={"face": True},
+            custom_rules={"medical_id": {"replacement_text": "[P1]"}}
+        )
+        parent2 = RedactionProfile(
+            name="parent2",
+            description="Parent 2",
+            visual_rules={"face": False, "signature": False},
+            text_rules={"email": True}
+        )
+        child = RedactionProfile(
+            name="child",
+            description="Child",
+            visual_rules={"signature": True},
+            inherits_from=["parent1", "parent2"]
+        )
+        
+        merged = child._merge_chain([parent1, parent2])
+        
+        assert merged.visual_rules == {"face": True, "signature": True}
+        assert merged.text_rules == {"email": True}
+        assert merged.inherits_from == []
+        
+        # Nested parent rules are copied, not shared
+        merged.custom_rules["medical_id"]["replacement_text"] = "[CHANGED]"
+        assert parent1.custom_rules["medical_id"]["replacement_text"] == "[P1]"
+    
     def test_detect_conflicts(self):
         """Test conflict detection between profiles."""
         profile1 = RedactionProfile(
@@ -539,6 +602,31 @@ confidence_threshold: 0.8
             # Should be the same object (cached)
             assert profile1 is profile2
     
+    def test_yaml_parse_cache(self):
+        """Test parsed YAML is reused until the file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            profile_path = temp_path / "parsed_profile.yaml"
+            profile_path.write_text("name: parsed_profile\ndescription: First\n")
+            
+            manager = ProfileManager([temp_path])
+            first = manager._load_yaml_file(profile_path)
+            
+            with patch('src.gopnik.models.profiles.yaml.load') as mock_load:
+                second = manager._load_yaml_file(profile_path)
+                mock_load.assert_not_called()
+            
+            # Callers get independent copies
+            assert second == first
+            assert second is not first
+            
+            # Rewriting the file invalidates the cached parse
+            profile_path.write_text("name: parsed_profile\ndescription: Second\n")
+            stat = profile_path.stat()
+            os.utime(profile_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            
+            assert manager._load_yaml_file(profile_path)['description'] == "Second"
+    
     def test_list_profiles(self):
         """Test listing available profiles."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -589,6 +677,20 @@ confidence_threshold: 0.8
         assert len(errors) > 0
         assert any("Profile name must be a non-empty string" in error for error in errors)
     
+    def test_validate_profile_after_mutation(self):
+        """Test a profile changed after passing validation is validated again."""
+        profile = RedactionProfile(
+            name="mutated_profile",
+            description="Valid profile"
+        )
+        
+        manager = ProfileManager()
+        assert manager.validate_profile(profile) == []
+        
+        profile.confidence_threshold = 5.0
+        errors = manager.validate_profile(profile)
+        assert any("Confidence threshold" in error for error in errors)
+    
     def test_create_composite_profile(self):
         """Test creating composite profile."""
         profile1 = RedactionProfile(
@@ -770,49 +872,124 @@ class TestProfileInheritance:
             
             assert "Circular inheritance detected" in str(exc_info.value)
     
-    def test_multiple_inheritance(self):
+    def test_circular_inheritance_unusual_key_spacing(self, tmp_path):
+        """Test cycles are found when the header peek cannot match inherits_from."""
+        (tmp_path / "a.yaml").write_text("name: a\ndescription: A\ninherits_from : [b]\n")
+        (tmp_path / "b.yaml").write_text("name: b\ndescription: B\ninherits_from : [a]\n")
+        
+        assert ProfileManager._load_header(tmp_path / "a.yaml") is None
+        
+        manager = ProfileManager([tmp_path])
+        with pytest.raises(ProfileValidationError, match="Circular inheritance detected"):
+            manager.load_profile("a", resolve_inheritance=True)
+    
+    def test_multiple_inheritance(self, tmp_path):
         """Test profile with multiple parents."""
+        # Create parent profiles and a child that inherits from both
+        for name, text in MULTI_INHERITANCE_PROFILES.items():
+            (tmp_path / f"{name}.yaml").write_text(text)
+        
+        manager = ProfileManager([tmp_path])
+        resolved_profile = manager.load_profile("multi_child", resolve_inheritance=True)
+        
+        # Should have rules from both parents plus child's own rules
+        assert resolved_profile.visual_rules['face'] is True  # From parent1
+        assert resolved_profile.visual_rules['signature'] is True  # From parent2
+        assert resolved_profile.visual_rules['barcode'] is True  # From child
+        assert resolved_profile.text_rules['email'] is True  # From parent1
+        assert resolved_profile.text_rules['phone'] is True  # From parent2
+        
+        # Languages should be combined
+        assert set(resolved_profile.multilingual_support) == {'en', 'es'}
+    
+    def test_diamond_inheritance_order(self, tmp_path):
+        """Test shared ancestors resolve once, behind every profile inheriting them."""
+        for name, text in DIAMOND_PROFILES.items():
+            (tmp_path / f"{name}.yaml").write_text(text)
+        
+        manager = ProfileManager([tmp_path])
+        resolved_profile = manager.load_profile("diamond", resolve_inheritance=True)
+        
+        assert manager._mro_cache['diamond'] == ['diamond', 'left', 'right', 'base']
+        # base must not override left just because right also inherits it
+        assert resolved_profile.visual_rules['face'] is True
+        assert resolved_profile.text_rules['email'] is True
+    
+    def test_inheritance_by_file_name(self, tmp_path):
+        """Test parents are resolved by file name when their name field differs."""
+        (tmp_path / "base.yaml").write_text(
+            "name: Base Profile\ndescription: Base\nvisual_rules:\n  face: true\n"
+        )
+        (tmp_path / "child.yaml").write_text(
+            "name: Child Profile\ndescription: Child\ninherits_from:\n- base\n"
+            "text_rules:\n  email: true\n"
+        )
+        
+        manager = ProfileManager([tmp_path])
+        resolved_profile = manager.load_profile("child", resolve_inheritance=True)
+        
+        assert manager._mro_cache['child'] == ['child', 'base']
+        assert resolved_profile.name == "Child Profile"
+        assert resolved_profile.visual_rules['face'] is True
+        assert resolved_profile.text_rules['email'] is True
+    
+    def test_load_header(self):
+        """Test reading inheritance metadata from a profile header."""
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
             
-            # Create parent profiles
-            parent1_data = {
-                'name': 'parent1',
-                'description': 'Parent 1',
-                'visual_rules': {'face': True},
-                'text_rules': {'email': True},
-                'multilingual_support': ['en']
-            }
+            block_path = temp_path / "block.yaml"
+            with open(block_path, 'w') as f:
+                yaml.dump({
+                    'name': 'block',
+                    'description': 'Block style list',
+                    'inherits_from': ['parent1', 'parent2']
+                }, f)
+            
+            flow_path = temp_path / "flow.yaml"
+            flow_path.write_text("# Flow style list\nname: flow\ninherits_from: [parent1]\n")
+            
+            # inherits_from falls outside the header window
+            long_path = temp_path / "long.yaml"
+            long_path.write_text(
+                "name: long\n" + "".join(f"key{i}: {i}\n" for i in range(30)) + "inherits_from: [parent1]\n"
+            )
             
-            parent2_data = {
-                'name': 'parent2',
-                'description': 'Parent 2',
-                'visual_rules': {'signature': True},
-                'text_rules': {'phone': True},
-                'multilingual_support': ['es']
+            assert ProfileManager._load_header(block_path) == {
+                'name': 'block', 'inherits_from': ['parent1', 'parent2']
             }
-            
-            # Create child that inherits from both
-            child_data = {
-                'name': 'multi_child',
-                'description': 'Multi-inheritance child',
-                'inherits_from': ['parent1', 'parent2'],
-                'visual_rules': {'barcode': True}
+            assert ProfileManager._load_header(flow_path) == {
+                'name': 'flow', 'inherits_from': ['parent1']
             }
+            assert ProfileManager._load_header(long_path) is None
+    
+    def test_circular_inheritance_multi_hop(self):
+        """Test cycles spanning several profiles are reported with their path."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
             
-            for name, data in [('parent1', parent1_data), ('parent2', parent2_data), ('multi_child', child_data)]:
-                with open(temp_path / f"{name}.yaml", 'w') as f:
-                    yaml.dump(data, f)
+            (temp_path / "hop_a.yaml").write_text("name: hop_a\ndescription: A\ninherits_from: [hop_b]\n")
+            (temp_path / "hop_b.yaml").write_text("name: hop_b\ndescription: B\ninherits_from: [hop_c]\n")
+            (temp_path / "hop_c.yaml").write_text("name: hop_c\ndescription: C\ninherits_from: [hop_a]\n")
             
             manager = ProfileManager([temp_path])
-            resolved_profile = manager.load_profile("multi_child", resolve_inheritance=True)
             
-            # Should have rules from both parents plus child's own rules
-            assert resolved_profile.visual_rules['face'] is True  # From parent1
-            assert resolved_profile.visual_rules['signature'] is True  # From parent2
-            assert resolved_profile.visual_rules['barcode'] is True  # From child
-            assert resolved_profile.text_rules['email'] is True  # From parent1
-            assert resolved_profile.text_rules['phone'] is True  # From parent2
+            with pytest.raises(ProfileValidationError) as exc_info:
+                manager.load_profile("hop_a", resolve_inheritance=True)
+            
+            assert "hop_a -> hop_b -> hop_c -> hop_a" in str(exc_info.value)
+    
+    def test_unrelated_cycle_does_not_block_loading(self):
+        """Test a cycle elsewhere in the directory does not affect other profiles."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            
+            (temp_path / "base.yaml").write_text("name: base\ndescription: Base\nvisual_rules:\n  face: true\n")
+            (temp_path / "child.yaml").write_text("name: child\ndescription: Child\ninherits_from: [base]\n")
+            (temp_path / "loop_a.yaml").write_text("name: loop_a\ndescription: A\ninherits_from: [loop_b]\n")
+            (temp_path / "loop_b.yaml").write_text("name: loop_b\ndescription: B\ninherits_from: [loop_a]\n")
+            
+            manager = ProfileManager([temp_path])
+            resolved_profile = manager.load_profile("child", resolve_inheritance=True)
             
-            # Languages should be combined
-            assert set(resolved_profile.multilingual_support) == {'en', 'es'}
\ No newline at end of file
+            assert resolved_profile.visual_rules == {'face': True}
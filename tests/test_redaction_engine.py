@@ -6,7 +6,6 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from PIL import Image
-import tempfile
 import io
 
 from src.gopnik.core.redaction import RedactionEngine
@@ -19,10 +18,11 @@ from src.gopnik.models.errors import DocumentProcessingError
 class TestRedactionEngine:
     """Test cases for RedactionEngine class."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Set up test fixtures."""
-        self.engine = RedactionEngine()
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
+        self.engine = RedactionEngine(temp_dir=tmp_path / 'output')
         
         # Create test detection
         self.test_detection = PIIDetection(
@@ -42,20 +42,21 @@ class TestRedactionEngine:
             confidence_threshold=0.8
         )
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        # Clean up temp files
-        for file in self.temp_dir.glob('*'):
-            file.unlink()
-        self.temp_dir.rmdir()
-    
     def test_init(self):
         """Test redaction engine initialization."""
         assert self.engine.preserve_layout() == True
+        assert self.engine.temp_dir == self.temp_dir / 'output'
         assert self.engine.temp_dir.exists()
         assert len(self.engine.style_configs) == 4
         assert RedactionStyle.SOLID_BLACK in self.engine.style_configs
     
+    def test_init_default_temp_dir(self):
+        """Test the engine falls back to the shared temp directory."""
+        import tempfile
+        
+        engine = RedactionEngine()
+        assert engine.temp_dir == Path(tempfile.gettempdir()) / "gopnik_redaction"
+    
     def test_preserve_layout(self):
         """Test layout preservation flag."""
         assert self.engine.preserve_layout() == True
@@ -114,6 +115,29 @@ class TestRedactionEngine:
         assert copy_path.name.startswith('redacted_')
         assert copy_path.read_text() == 'test content'
     
+    def test_create_copy_fallback(self):
+        """Test document copying when copy_file_range is unsupported."""
+        test_file = self.temp_dir / 'test.bin'
+        content = bytes(range(256)) * 4096
+        test_file.write_bytes(content)
+        
+        with patch('src.gopnik.core.redaction.os.copy_file_range', side_effect=OSError, create=True):
+            copy_path = self.engine._create_copy(test_file)
+        
+        assert copy_path.read_bytes() == content
+        assert copy_path.stat().st_mtime == test_file.stat().st_mtime
+    
+    def test_create_copy_no_progress(self):
+        """Test a copy_file_range that stops making progress falls back to a full copy."""
+        test_file = self.temp_dir / 'test.bin'
+        content = bytes(range(256)) * 4096
+        test_file.write_bytes(content)
+        
+        with patch('src.gopnik.core.redaction.os.copy_file_range', return_value=0, create=True):
+            copy_path = self.engine._create_copy(test_file)
+        
+        assert copy_path.read_bytes() == content
+    
     def test_get_text_replacement(self):
         """Test text replacement generation."""
         profile = RedactionProfile(
@@ -130,6 +154,17 @@ class TestRedactionEngine:
         profile.custom_rules = {PIIType.NAME.value: {'replacement_text': '[CUSTOM]'}}
         assert self.engine._get_text_replacement(PIIType.NAME, "John", profile) == "[CUSTOM]"
     
+    def test_get_text_replacement_non_dict_custom_rule(self):
+        """Test custom rules without replacement text fall back to defaults."""
+        profile = RedactionProfile(
+            name="test",
+            description="Test profile",
+            custom_rules={PIIType.SSN.value: True}
+        )
+        
+        assert self.engine._get_text_replacement(PIIType.SSN, "123-45-6789", profile) == "[SSN REDACTED]"
+        assert self.engine._get_text_replacement(PIIType.SIGNATURE, "", profile) == "[REDACTED]"
+    
     def test_apply_text_redaction(self):
         """Test text content redaction."""
         text_content = "Hello John Doe, your email is john@example.com"
@@ -152,6 +187,30 @@ class TestRedactionEngine:
         assert "[NAME REDACTED]" in redacted_text
         assert "john@example.com" in redacted_text  # Email should remain
     
+    def test_apply_text_redactions_batch(self):
+        """Test redacting several detections in one pass."""
+        text_content = "john doe wrote to John Doe Jr at john@example.com; call 555-0100"
+        detections = [
+            PIIDetection(PIIType.NAME, BoundingBox(0, 0, 100, 50), 0.9, text_content="John Doe"),
+            PIIDetection(PIIType.NAME, BoundingBox(0, 0, 100, 50), 0.9, text_content="John Doe Jr"),
+            PIIDetection(PIIType.EMAIL, BoundingBox(0, 0, 100, 50), 0.9, text_content="john@example.com"),
+            PIIDetection(PIIType.PHONE, BoundingBox(0, 0, 100, 50), 0.9, text_content="555-0100")
+        ]
+        
+        profile = RedactionProfile(
+            name="test",
+            description="Test profile",
+            text_rules={PIIType.NAME.value: True, PIIType.EMAIL.value: True, PIIType.PHONE.value: False},
+            custom_rules={PIIType.EMAIL.value: {'replacement_text': r'[\1 EMAIL]'}}
+        )
+        
+        redacted_text = self.engine._apply_text_redactions(text_content, detections, profile)
+        
+        # Case-insensitive, longest match wins, replacements are literal
+        assert redacted_text == (
+            "[NAME REDACTED] wrote to [NAME REDACTED] at [\\1 EMAIL]; call 555-0100"
+        )
+    
     def test_apply_text_redaction_no_text_content(self):
         """Test text redaction when detection has no text content."""
         text_content = "Hello world"
@@ -215,16 +274,30 @@ class TestRedactionEngine:
         # Mock PIL Image
         mock_img = Mock()
         mock_img.mode = 'RGB'
-        mock_img.copy.return_value = mock_img
         mock_img.save = Mock()
         
         mock_image_open.return_value.__enter__.return_value = mock_img
         
-        # Mock the detection redaction
-        with patch.object(self.engine, '_apply_image_detection_redaction', return_value=mock_img):
-            result_path = self.engine._apply_image_redactions(test_image, [self.test_detection], self.test_profile)
+        second_detection = PIIDetection(
+            type=PIIType.NAME,
+            bounding_box=BoundingBox(10, 10, 60, 40),
+            confidence=0.9,
+            text_content="Jane Doe",
+            page_number=0
+        )
+        
+        # All rectangles on the page share a single drawing context
+        mock_draw = Mock()
+        with patch('src.gopnik.core.redaction.ImageDraw.Draw', return_value=mock_draw) as mock_draw_cls:
+            result_path = self.engine._apply_image_redactions(
+                test_image, [self.test_detection, second_detection], self.test_profile
+            )
             
             assert result_path.name.startswith('redacted_')
+            mock_draw_cls.assert_called_once_with(mock_img)
+            assert mock_draw.rectangle.call_count == 2
+            mock_img.load.assert_called_once()
+            mock_img.copy.assert_not_called()
             mock_img.save.assert_called_once()
     
     @patch('src.gopnik.core.redaction.fitz.open')
@@ -253,8 +326,162 @@ class TestRedactionEngine:
         mock_page.add_redact_annot.assert_called_once()
         mock_page.apply_redactions.assert_called_once()
         mock_doc.save.assert_called_once()
+        assert mock_doc.save.call_args[1]['garbage'] == 4
+        mock_doc.close.assert_called_once()
+    
+    @patch('src.gopnik.core.redaction.fitz.open')
+    def test_apply_pdf_redactions_closes_on_failure(self, mock_fitz_open):
+        """Test the PDF is closed when redaction fails part way."""
+        test_pdf = self.temp_dir / 'test.pdf'
+        test_pdf.write_bytes(b'fake pdf data')
+        
+        mock_doc = Mock()
+        mock_doc.__len__ = Mock(return_value=1)
+        mock_doc.load_page.side_effect = RuntimeError("corrupt page")
+        mock_fitz_open.return_value = mock_doc
+        
+        with pytest.raises(DocumentProcessingError, match="corrupt page"):
+            self.engine._apply_pdf_redactions(test_pdf, [self.test_detection], self.test_profile)
+        
         mock_doc.close.assert_called_once()
     
+    def test_apply_pdf_redactions_parallel(self):
+        """Test multi-page PDF redaction across worker processes."""
+        import fitz
+        
+        # Create a real 5 page PDF with one secret per page
+        test_pdf = self.temp_dir / 'multi.pdf'
+        doc = fitz.open()
+        for page_num in range(5):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"SECRET{page_num}")
+            page.insert_text((72, 300), f"public page {page_num}")
+        doc.set_metadata({'title': 'Parallel test'})
+        doc.set_toc([[1, f"Page {page_num}", page_num + 1] for page_num in range(5)])
+        doc.load_page(0).insert_link({
+            'kind': fitz.LINK_GOTO, 'from': fitz.Rect(72, 400, 200, 420),
+            'page': 3, 'to': fitz.Point(0, 0)
+        })
+        doc.load_page(4).insert_link({
+            'kind': fitz.LINK_GOTO, 'from': fitz.Rect(72, 400, 200, 420),
+            'page': 1, 'to': fitz.Point(0, 0)
+        })
+        doc.save(str(test_pdf))
+        doc.close()
+        
+        detections = [
+            PIIDetection(PIIType.NAME, BoundingBox(60, 50, 250, 80), 0.9, page_number=page_num)
+            for page_num in range(5)
+        ]
+        
+        parallel_results = []
+        apply_parallel = self.engine._apply_pdf_redactions_parallel
+        
+        def record_parallel(*args):
+            parallel_results.append(apply_parallel(*args))
+            return parallel_results[-1]
+        
+        self.engine.parallel_page_threshold = 2
+        with patch('src.gopnik.core.redaction.os.cpu_count', return_value=3), \
+             patch.object(self.engine, '_apply_pdf_redactions_parallel', side_effect=record_parallel):
+            result_path = self.engine._apply_pdf_redactions(test_pdf, detections, self.test_profile)
+        
+        # Pages were redacted by the worker processes, not the serial fallback
+        assert len(parallel_results) == 1
+        assert parallel_results[0] is not None
+        
+        result = fitz.open(str(result_path))
+        try:
+            assert len(result) == 5
+            assert result.metadata['title'] == 'Parallel test'
+            for page_num in range(5):
+                text = result.load_page(page_num).get_text()
+                assert f"SECRET{page_num}" not in text
+                assert f"public page {page_num}" in text
+            
+            # Outline and links still point at the spliced-in pages
+            assert [entry[2] for entry in result.get_toc()] == [1, 2, 3, 4, 5]
+            assert [link['page'] for link in result.load_page(0).get_links()] == [3]
+            assert [link['page'] for link in result.load_page(4).get_links()] == [1]
+        finally:
+            result.close()
+    
+    def _redact_with_three_workers(self, pdf_path, page_count):
+        """Redact one box per page with the parallel path enabled."""
+        detections = [
+            PIIDetection(PIIType.NAME, BoundingBox(60, 50, 250, 80), 0.9, page_number=page_num)
+            for page_num in range(page_count)
+        ]
+        self.engine.parallel_page_threshold = 4
+        with patch('src.gopnik.core.redaction.os.cpu_count', return_value=3):
+            return self.engine._apply_pdf_redactions(pdf_path, detections, self.test_profile)
+    
+    def test_apply_pdf_redactions_parallel_keeps_widgets_and_labels(self):
+        """Test form fields and page labels survive when parallel redaction is enabled."""
+        import fitz
+        
+        test_pdf = self.temp_dir / 'form.pdf'
+        doc = fitz.open()
+        for page_num in range(6):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"SECRET{page_num}")
+            widget = fitz.Widget()
+            widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
+            widget.field_name = f"field_{page_num}"
+            widget.rect = fitz.Rect(72, 400, 300, 420)
+            page.add_widget(widget)
+        doc.set_page_labels([{'startpage': 0, 'prefix': 'A-', 'style': 'D', 'firstpagenum': 1}])
+        doc.save(str(test_pdf))
+        doc.close()
+        
+        result_path = self._redact_with_three_workers(test_pdf, 6)
+        
+        result = fitz.open(str(result_path))
+        try:
+            assert [len(list(page.widgets())) for page in result] == [1] * 6
+            assert [page.get_label() for page in result] == [f"A-{n}" for n in range(1, 7)]
+            for page_num in range(6):
+                assert f"SECRET{page_num}" not in result.load_page(page_num).get_text()
+        finally:
+            result.close()
+    
+    def test_apply_pdf_redactions_parallel_splice_failure(self):
+        """Test a failed splice falls back to serial redaction of an intact document."""
+        import fitz
+        
+        test_pdf = self.temp_dir / 'multi.pdf'
+        doc = fitz.open()
+        for page_num in range(5):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"SECRET{page_num}")
+            page.insert_text((72, 300), f"public page {page_num}")
+        doc.save(str(test_pdf))
+        doc.close()
+        
+        insert_pdf = fitz.Document.insert_pdf
+        calls = []
+        
+        def failing_insert_pdf(self, *args, **kwargs):
+            # Let the first page through so the copy is left half spliced
+            calls.append(args)
+            if len(calls) > 1:
+                raise RuntimeError("splice failed")
+            return insert_pdf(self, *args, **kwargs)
+        
+        with patch.object(fitz.Document, 'insert_pdf', failing_insert_pdf):
+            result_path = self._redact_with_three_workers(test_pdf, 5)
+        
+        assert len(calls) == 2
+        result = fitz.open(str(result_path))
+        try:
+            assert len(result) == 5
+            for page_num in range(5):
+                text = result.load_page(page_num).get_text()
+                assert f"SECRET{page_num}" not in text
+                assert f"public page {page_num}" in text
+        finally:
+            result.close()
+    
     def test_apply_redactions_no_detections(self):
         """Test redaction with no detections."""
         test_file = self.temp_dir / 'test.txt'
@@ -343,6 +570,28 @@ class TestRedactionEngine:
         assert isinstance(result, Image.Image)
         assert result.size == (200, 200)
     
+    def test_apply_pixelation_matches_cropped_region(self):
+        """Test pixelation samples the region without cropping first."""
+        img = Image.effect_noise((200, 200), 64).convert('RGB')
+        bbox = BoundingBox(13, 7, 171, 133)
+        
+        # Reference: crop, downscale, upscale
+        expected = img.crop(bbox.to_tuple()).resize((10, 8), Image.NEAREST)
+        expected = expected.resize((bbox.width, bbox.height), Image.NEAREST)
+        
+        result = self.engine._apply_pixelation(img.copy(), bbox)
+        
+        assert result.crop(bbox.to_tuple()).tobytes() == expected.tobytes()
+    
+    def test_apply_pixelation_region_outside_image(self):
+        """Test pixelation of a region extending past the image edge."""
+        img = Image.new('RGB', (100, 100), color='red')
+        bbox = BoundingBox(50, 50, 150, 150)
+        
+        result = self.engine._apply_pixelation(img, bbox)
+        
+        assert result.size == (100, 100)
+    
     def test_apply_blur(self):
         """Test blur effect application."""
         # Create a test image
@@ -374,6 +623,24 @@ class TestRedactionEngine:
         pixel_config = configs[RedactionStyle.PIXELATED]
         assert pixel_config['pattern'] == 'pixelate'
         assert pixel_config['color'] is None
+    
+    def test_style_table_covers_all_styles(self):
+        """Test every redaction style resolves, falling back to solid black."""
+        for style in RedactionStyle:
+            assert style in self.engine._style_table
+        
+        assert self.engine._style_table[RedactionStyle.BLURRED] is self.engine.style_configs[RedactionStyle.BLURRED]
+        assert self.engine._style_table[RedactionStyle.PATTERN] is self.engine.style_configs[RedactionStyle.SOLID_BLACK]
+    
+    def test_lazy_module_attributes(self):
+        """Test lazily imported modules resolve as module attributes."""
+        import fitz
+        from src.gopnik.core import redaction
+        
+        assert redaction.fitz is fitz
+        assert redaction.Image is Image
+        with pytest.raises(AttributeError):
+            redaction.not_a_module
 
 
 if __name__ == '__main__':
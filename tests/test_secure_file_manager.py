@@ -2,34 +2,55 @@
 Tests for secure file manager functionality.
 """
 
+import base64
 import os
 import stat
-import tempfile
-import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 import pytest
 
+from src.gopnik.utils import secure_file_manager
 from src.gopnik.utils.secure_file_manager import SecureFileManager, SecureFileHandle
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
+
+
+class StubDecryptionError(Exception):
+    """Stand-in for rfernet.DecryptionError."""
+
+
+class StubRFernet:
+    """Stand-in for rfernet.Fernet, which takes and returns str tokens."""
+    
+    def __init__(self, key):
+        self._fernet = Fernet(key.encode('ascii'))
+    
+    def encrypt(self, data):
+        return self._fernet.encrypt(data).decode('ascii')
+    
+    def decrypt(self, token):
+        try:
+            return self._fernet.decrypt(token.encode('ascii'))
+        except InvalidToken:
+            raise StubDecryptionError("invalid token")
+
+
+STUB_RFERNET = SimpleNamespace(Fernet=StubRFernet, DecryptionError=StubDecryptionError)
 
 
 class TestSecureFileManager:
     """Test cases for SecureFileManager."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Set up test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
         self.manager = SecureFileManager(base_dir=self.temp_dir)
-    
-    def teardown_method(self):
-        """Clean up test environment."""
+        yield
+        # pytest removes tmp_path itself, only the manager needs cleanup
         self.manager.cleanup_all()
-        # Clean up temp directory
-        import shutil
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
     
     def test_create_secure_temp_file(self):
         """Test creating secure temporary file."""
@@ -146,6 +167,20 @@ class TestSecureFileManager:
         # Verify directory and contents are cleaned up
         assert not temp_dir.exists()
     
+    def test_secure_temp_dir_nested_cleanup(self):
+        """Test directory cleanup removes nested files but leaves symlink targets alone."""
+        outside_file = self.temp_dir / "outside.txt"
+        outside_file.write_text("outside content")
+        
+        with self.manager.secure_temp_dir() as temp_dir:
+            nested_dir = temp_dir / "nested" / "deeper"
+            nested_dir.mkdir(parents=True)
+            (nested_dir / "inner.txt").write_text("inner content")
+            (temp_dir / "link.txt").symlink_to(outside_file)
+        
+        assert not temp_dir.exists()
+        assert outside_file.read_text() == "outside content"
+    
     def test_secure_delete_file(self):
         """Test secure file deletion."""
         # Create a test file with known content
@@ -179,6 +214,89 @@ class TestSecureFileManager:
         assert result is True
         assert not test_file.exists()
     
+    def test_secure_delete_file_overwrite_fallback(self):
+        """Test deletion overwrites the file when blocks cannot be discarded."""
+        test_file = self.temp_dir / "test_fallback.txt"
+        test_file.write_text("Overwrite fallback test")
+        
+        fill_values = []
+        
+        def record_fill(mapping, value):
+            fill_values.append(value)
+            mapping[:] = b'\x00' * len(mapping)
+        
+        with patch('src.gopnik.utils.secure_file_manager._punch_hole', return_value=False) as punch, \
+                patch('src.gopnik.utils.secure_file_manager._fill_mapping', side_effect=record_fill):
+            result = self.manager.secure_delete_file(test_file, passes=3, discard=True)
+        
+        assert result is True
+        assert not test_file.exists()
+        punch.assert_called_once()
+        assert fill_values == [None, 0x00, 0xFF]
+    
+    def test_random_pass_chunks(self):
+        """Test the random overwrite pass covers the file with fresh data each pass."""
+        size = secure_file_manager._OVERWRITE_CHUNK + 100
+        
+        first = b''.join(bytes(chunk) for _, chunk in secure_file_manager._pass_chunks(size, None))
+        second = b''.join(bytes(chunk) for _, chunk in secure_file_manager._pass_chunks(size, None))
+        
+        assert len(first) == len(second) == size
+        assert first != second
+        assert first.count(0) < size // 128
+    
+    def _delete_and_capture(self, test_file, **kwargs):
+        """Securely delete a file, returning its contents just before unlink."""
+        captured = []
+        real_unlink = Path.unlink
+        
+        def capture_unlink(path, *args, **kw):
+            captured.append(path.read_bytes())
+            return real_unlink(path, *args, **kw)
+        
+        with patch.object(Path, 'unlink', capture_unlink):
+            result = self.manager.secure_delete_file(test_file, **kwargs)
+        
+        assert result is True
+        assert not test_file.exists()
+        return captured[0]
+    
+    def test_secure_delete_file_overwrites_contents(self):
+        """Test deletion without discard really overwrites the file before unlinking it."""
+        test_file = self.temp_dir / "test_overwrite.txt"
+        original = b"sensitive " * 500
+        test_file.write_bytes(original)
+        
+        contents = self._delete_and_capture(test_file, passes=3, discard=False)
+        
+        assert contents == b'\xFF' * len(original)
+    
+    def test_secure_delete_file_without_mmap(self):
+        """Test deletion overwrites with plain writes when the file cannot be mapped."""
+        test_file = self.temp_dir / "test_no_mmap.txt"
+        original = b"sensitive " * 500
+        test_file.write_bytes(original)
+        
+        with patch('src.gopnik.utils.secure_file_manager.mmap.mmap', side_effect=OSError("no mmap")):
+            contents = self._delete_and_capture(test_file, passes=2)
+        
+        assert contents == bytes(len(original))
+    
+    def test_secure_delete_file_discard_opt_in(self):
+        """Test deletion only releases blocks when discard is requested."""
+        test_file = self.temp_dir / "test_discard.txt"
+        test_file.write_text("Discard opt-in test")
+        
+        with patch('src.gopnik.utils.secure_file_manager._punch_hole', return_value=True) as punch:
+            assert self.manager.secure_delete_file(test_file) is True
+            punch.assert_not_called()
+            
+            test_file.write_text("Discard opt-in test")
+            assert self.manager.secure_delete_file(test_file, discard=True) is True
+            punch.assert_called_once()
+        
+        assert not test_file.exists()
+    
     def test_set_file_permissions(self):
         """Test setting file permissions."""
         temp_file = self.manager.create_secure_temp_file()
@@ -201,6 +319,16 @@ class TestSecureFileManager:
         # Verify incorrect permissions
         assert self.manager.verify_file_permissions(temp_file, 0o644) is False
     
+    def test_verify_file_permissions_external_change(self):
+        """Test permission checks see changes made outside the manager."""
+        temp_file = self.manager.create_secure_temp_file(mode=0o600)
+        assert self.manager.verify_file_permissions(temp_file, 0o600) is True
+        
+        os.chmod(temp_file, 0o644)
+        
+        assert self.manager.verify_file_permissions(temp_file, 0o600) is False
+        assert self.manager.verify_file_permissions(temp_file, 0o644) is True
+    
     def test_cleanup_all(self):
         """Test cleaning up all temporary files and directories."""
         # Create multiple temp files and directories
@@ -246,36 +374,74 @@ class TestSecureFileManager:
         manager1.cleanup_all()
         manager2.cleanup_all()
     
+    def test_rfernet_backend(self):
+        """Test the rfernet backend keeps bytes tokens and InvalidToken errors."""
+        with patch.object(secure_file_manager, 'HAS_RFERNET', True), \
+                patch.object(secure_file_manager, 'rfernet', STUB_RFERNET):
+            manager = SecureFileManager(base_dir=self.temp_dir)
+            temp_file = manager.create_secure_temp_file()
+            
+            manager.write_encrypted_data(temp_file, b"rfernet data")
+            key = manager.get_encryption_key()
+            assert Fernet(key).decrypt(temp_file.read_bytes()) == b"rfernet data"
+            assert manager.read_encrypted_data(temp_file) == b"rfernet data"
+            
+            temp_file.write_bytes(Fernet(Fernet.generate_key()).encrypt(b"other key"))
+            with pytest.raises(InvalidToken):
+                manager.read_encrypted_data(temp_file)
+            
+            manager.cleanup_all()
+    
+    def test_pooled_iv_tokens(self):
+        """Test pooled IVs give unique, standard Fernet tokens across pool refills."""
+        key = Fernet.generate_key()
+        cipher = secure_file_manager._create_fernet(key)
+        
+        tokens = [cipher.encrypt(b"pooled iv data") for _ in range(300)]
+        ivs = {base64.urlsafe_b64decode(token)[9:25] for token in tokens}
+        
+        assert len(ivs) == len(tokens)
+        assert all(Fernet(key).decrypt(token) == b"pooled iv data" for token in tokens)
+    
+    def test_iv_pool_refills_after_fork(self):
+        """Test the IV pool is discarded when the process id changes."""
+        pool = secure_file_manager._IVPool()
+        first = pool.take()
+        
+        with patch('src.gopnik.utils.secure_file_manager.os.getpid', return_value=-1), \
+                patch('src.gopnik.utils.secure_file_manager.secrets.token_bytes',
+                      wraps=secure_file_manager.secrets.token_bytes) as token_bytes:
+            second = pool.take()
+            pool.take()
+        
+        token_bytes.assert_called_once_with(pool.POOL_SIZE)
+        assert first != second
+    
+    def test_per_file_key_cipher_reuse(self):
+        """Test files recorded with their own key use one cached cipher per key."""
+        temp_file = self.manager.create_secure_temp_file()
+        file_key = Fernet.generate_key()
+        self.manager.encrypted_files[temp_file] = file_key
+        
+        self.manager.write_encrypted_data(temp_file, b"per-file key data")
+        cipher = self.manager._file_ciphers[file_key]
+        
+        assert self.manager.read_encrypted_data(temp_file) == b"per-file key data"
+        assert self.manager._file_ciphers[file_key] is cipher
+        assert Fernet(file_key).decrypt(temp_file.read_bytes()) == b"per-file key data"
+        
+        self.manager.cleanup_all()
+        assert self.manager._file_ciphers == {}
+    
     def test_thread_safety(self):
         """Test thread safety of secure file manager."""
-        results = []
-        errors = []
-        
-        def create_files():
-            try:
-                for i in range(3):  # Reduced from 10 to 3
-                    temp_file = self.manager.create_secure_temp_file()
-                    results.append(temp_file)
-                    # Removed sleep to speed up test
-            except Exception as e:
-                errors.append(e)
-        
-        # Create multiple threads
-        threads = []
-        for _ in range(3):  # Reduced from 5 to 3
-            thread = threading.Thread(target=create_files)
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        # Verify no errors occurred
-        assert len(errors) == 0
+        # 3 workers * 3 files each, collected as they complete
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(self.manager.create_secure_temp_file) for _ in range(9)]
+            results = [future.result() for future in as_completed(futures)]
         
         # Verify all files were created
-        assert len(results) == 9  # 3 threads * 3 files each
+        assert len(results) == 9
         
         # Verify all files are unique
         assert len(set(results)) == 9
@@ -301,17 +467,12 @@ class TestSecureFileManager:
 class TestSecureFileHandle:
     """Test cases for SecureFileHandle."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path):
         """Set up test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = tmp_path
         self.encryption_key = Fernet.generate_key()
     
-    def teardown_method(self):
-        """Clean up test environment."""
-        import shutil
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
     def test_secure_file_handle_encrypted_write_read(self):
         """Test encrypted write and read operations."""
         test_file = self.temp_dir / "test_encrypted.dat"
@@ -453,7 +614,9 @@ class TestSecureFileManagerIntegration:
                     manager.create_secure_temp_file()
             
             # Test handling of encryption errors
-            with patch.object(manager._fernet, 'encrypt', side_effect=Exception("Encryption failed")):
+            failing_fernet = MagicMock()
+            failing_fernet.encrypt.side_effect = Exception("Encryption failed")
+            with patch.object(manager, '_fernet', failing_fernet):
                 temp_file = manager.create_secure_temp_file()
                 with pytest.raises(Exception, match="Encryption failed"):
                     manager.write_encrypted_data(temp_file, "test data")
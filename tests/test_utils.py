@@ -2,14 +2,13 @@
 Test utilities and fixtures for comprehensive testing.
 """
 
-import tempfile
-import shutil
+import functools
+import importlib.util
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Generator
-from unittest.mock import Mock, MagicMock, patch
+from typing import Dict, List, Optional
+from unittest.mock import Mock, patch
 import pytest
-import json
-import yaml
 from PIL import Image
 
 from src.gopnik.models.pii import PIIDetection, PIIType, BoundingBox
@@ -17,13 +16,30 @@ from src.gopnik.models.processing import ProcessingResult, ProcessingStatus
 from src.gopnik.models.profiles import RedactionProfile
 from src.gopnik.models.audit import AuditLog, AuditOperation, AuditLevel
 
-# Optional numpy import for AI-related tests
-try:
-    import numpy as np
-    HAS_NUMPY = True
-except ImportError:
-    np = None
-    HAS_NUMPY = False
+# Optional numpy for image generation; imported on first use so that
+# collecting this module does not pay for it
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+_RNG = None
+
+
+def _get_rng():
+    """Return the shared numpy random Generator, creating it on first use."""
+    global _RNG
+    if _RNG is None:
+        import numpy as np
+        _RNG = np.random.default_rng()
+    return _RNG
+
+
+# Synthetic PII document body written by create_test_document_with_pii
+_PII_DOCUMENT_BYTES = b"""
+        John Doe
+        Email: john.doe@example.com
+        Phone: (555) 123-4567
+        SSN: 123-45-6789
+        Address: 123 Main St, Anytown, ST 12345
+        Credit Card: 4532-1234-5678-9012
+        """
 
 
 class TestDataGenerator:
@@ -31,14 +47,23 @@ class TestDataGenerator:
     
     @staticmethod
     def create_test_image(width: int = 800, height: int = 600, 
-                         format: str = "RGB") -> Image.Image:
-        """Create a test image with random content."""
+                         format: str = "RGB",
+                         random_pixels: bool = True) -> Image.Image:
+        """Create a test image with random content.
+
+        Pass ``random_pixels=False`` when only size and mode matter to get
+        a flat grey image without drawing random data.
+        """
+        if not random_pixels:
+            color = (128, 128, 128) if format == "RGB" else 128
+            return Image.new(format, (width, height), color=color)
+
         if HAS_NUMPY:
-            # Create random image data using numpy
-            if format == "RGB":
-                data = np.random.randint(0, 256, (height, width, 3), dtype=np.uint8)
-            else:
-                data = np.random.randint(0, 256, (height, width), dtype=np.uint8)
+            import numpy as np
+
+            # Create random image data using numpy's Generator API
+            shape = (height, width, 3) if format == "RGB" else (height, width)
+            data = _get_rng().integers(0, 256, size=shape, dtype=np.uint8)
             return Image.fromarray(data, format)
         else:
             # Create simple test image without numpy
@@ -59,17 +84,7 @@ class TestDataGenerator:
     def create_test_document_with_pii(temp_dir: Path) -> Path:
         """Create a test document containing synthetic PII."""
         doc_path = temp_dir / "test_document.txt"
-        
-        content = """
-        John Doe
-        Email: john.doe@example.com
-        Phone: (555) 123-4567
-        SSN: 123-45-6789
-        Address: 123 Main St, Anytown, ST 12345
-        Credit Card: 4532-1234-5678-9012
-        """
-        
-        doc_path.write_text(content)
+        doc_path.write_bytes(_PII_DOCUMENT_BYTES)
         return doc_path
     
     @staticmethod
@@ -163,13 +178,13 @@ class MockDocumentProcessor:
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for testing."""
-    temp_path = Path(tempfile.mkdtemp())
-    try:
-        yield temp_path
-    finally:
-        shutil.rmtree(temp_path, ignore_errors=True)
+def temp_dir(tmp_path: Path) -> Path:
+    """Provide an empty temporary directory for testing.
+
+    Backed by pytest's ``tmp_path`` so cleanup follows pytest's retention
+    policy instead of an rmtree after every test.
+    """
+    return tmp_path
 
 
 @pytest.fixture
@@ -302,13 +317,11 @@ class PerformanceTimer:
         self.end_time = None
     
     def __enter__(self):
-        import time
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        import time
-        self.end_time = time.time()
+        self.end_time = time.perf_counter()
         duration = self.end_time - self.start_time
         
         if duration > self.max_duration:
@@ -317,11 +330,12 @@ class PerformanceTimer:
     @property
     def duration(self) -> float:
         """Get the measured duration."""
-        if self.start_time and self.end_time:
+        if self.start_time is not None and self.end_time is not None:
             return self.end_time - self.start_time
         return 0.0
 
 
+@functools.lru_cache(maxsize=1)
 def skip_if_no_ai_models():
     """Skip test if AI models are not available."""
     try:
@@ -16,16 +16,25 @@ except ImportError:
     WEB_AVAILABLE = False
 
 
+@pytest.fixture(scope="module")
+def client():
+    """Create test client with web interface, shared across the module."""
+    app = create_app()
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def demo_html(client):
+    """Render the demo page once and share its HTML across the module."""
+    response = client.get("/demo")
+    assert response.status_code == 200
+    return response.text
+
+
 @pytest.mark.skipif(not WEB_AVAILABLE, reason="Web dependencies not available")
 class TestDemoPage:
     """Test cases for the demo page functionality."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client with web interface."""
-        app = create_app()
-        return TestClient(app)
-    
     def test_demo_page_loads(self, client):
         """Test that the demo page loads successfully."""
         response = client.get("/demo")
@@ -38,10 +47,9 @@ class TestDemoPage:
         assert "Upload Document" in content
         assert "Redaction Profile" in content
     
-    def test_demo_page_contains_upload_section(self, client):
+    def test_demo_page_contains_upload_section(self, demo_html):
         """Test that the demo page contains upload functionality."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for upload elements
         assert 'id="dropzone"' in content
@@ -55,10 +63,9 @@ class TestDemoPage:
         assert "JPG" in content
         assert "TIFF" in content
     
-    def test_demo_page_contains_profile_selection(self, client):
+    def test_demo_page_contains_profile_selection(self, demo_html):
         """Test that the demo page contains profile selection."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for profile options
         assert "Default" in content
@@ -72,10 +79,9 @@ class TestDemoPage:
         assert "PHI" in content
         assert "SSN" in content
     
-    def test_demo_page_contains_processing_controls(self, client):
+    def test_demo_page_contains_processing_controls(self, demo_html):
         """Test that the demo page contains processing controls."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for processing elements
         assert 'id="processBtn"' in content
@@ -83,10 +89,9 @@ class TestDemoPage:
         assert "Show preview before download" in content
         assert "Generate audit trail" in content
     
-    def test_demo_page_contains_status_section(self, client):
+    def test_demo_page_contains_status_section(self, demo_html):
         """Test that the demo page contains processing status section."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for status elements
         assert 'id="processingStatus"' in content
@@ -97,10 +102,9 @@ class TestDemoPage:
         assert "Detecting PII" in content
         assert "Applying redactions" in content
     
-    def test_demo_page_contains_results_section(self, client):
+    def test_demo_page_contains_results_section(self, demo_html):
         """Test that the demo page contains results section."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for results elements
         assert 'id="resultsSection"' in content
@@ -112,10 +116,9 @@ class TestDemoPage:
         assert "Preview Changes" in content
         assert "View Audit Trail" in content
     
-    def test_demo_page_contains_help_sidebar(self, client):
+    def test_demo_page_contains_help_sidebar(self, demo_html):
         """Test that the demo page contains help sidebar."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for help content
         assert "Help & Tips" in content
@@ -129,10 +132,9 @@ class TestDemoPage:
         assert "No data stored on servers" in content
         assert "Cryptographic audit trails" in content
     
-    def test_demo_page_responsive_design(self, client):
+    def test_demo_page_responsive_design(self, demo_html):
         """Test that the demo page has responsive design elements."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for responsive CSS classes and viewport meta tag
         assert 'name="viewport"' in content
@@ -145,10 +147,9 @@ class TestDemoPage:
         assert 'class="demo-layout"' in content
         assert 'class="help-sidebar"' in content
     
-    def test_demo_page_javascript_integration(self, client):
+    def test_demo_page_javascript_integration(self, demo_html):
         """Test that the demo page includes JavaScript functionality."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for JavaScript inclusion
         assert 'src="/static/js/demo.js"' in content
@@ -163,10 +164,9 @@ class TestDemoPage:
         assert 'data-profile="healthcare"' in content
         assert 'data-profile="financial"' in content
     
-    def test_demo_page_accessibility(self, client):
+    def test_demo_page_accessibility(self, demo_html):
         """Test that the demo page has accessibility features."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for semantic HTML elements
         assert '<main' in content
@@ -195,16 +195,9 @@ class TestDemoPage:
 class TestDemoFunctionality:
     """Test cases for demo page interactive functionality."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client with web interface."""
-        app = create_app()
-        return TestClient(app)
-    
-    def test_demo_page_navigation(self, client):
+    def test_demo_page_navigation(self, demo_html):
         """Test navigation elements on demo page."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for navigation links
         assert 'href="/"' in content  # Back to home
@@ -214,10 +207,9 @@ class TestDemoFunctionality:
         assert 'Gopnik' in content
         assert 'Demo' in content
     
-    def test_demo_page_form_elements(self, client):
+    def test_demo_page_form_elements(self, demo_html):
         """Test form elements and inputs on demo page."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for form inputs
         assert 'type="file"' in content
@@ -228,10 +220,9 @@ class TestDemoFunctionality:
         assert 'id="processBtn"' in content
         assert 'disabled' in content  # Process button should start disabled
     
-    def test_demo_page_css_classes(self, client):
+    def test_demo_page_css_classes(self, demo_html):
         """Test that demo page has proper CSS classes for styling."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_html
         
         # Check for key CSS classes
         assert 'class="card"' in content
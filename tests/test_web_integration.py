@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock, AsyncMock
 import io
 import json
+import time
 
 # Skip tests if web dependencies are not available
 try:
@@ -16,19 +17,32 @@ except ImportError:
     WEB_AVAILABLE = False
 
 
+@pytest.fixture(scope="module")
+def client():
+    """Create test client with web interface, shared across the module."""
+    app = create_app()
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def welcome_response(client):
+    """Fetch the welcome page once and share the response across the module."""
+    return client.get("/")
+
+
+@pytest.fixture(scope="module")
+def demo_response(client):
+    """Fetch the demo page once and share the response across the module."""
+    return client.get("/demo")
+
+
 @pytest.mark.skipif(not WEB_AVAILABLE, reason="Web dependencies not available")
 class TestWebIntegration:
     """Integration tests for the complete web interface."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client with full web interface."""
-        app = create_app()
-        return TestClient(app)
-    
-    def test_welcome_page_loads(self, client):
+    def test_welcome_page_loads(self, welcome_response):
         """Test that the welcome page loads with all components."""
-        response = client.get("/")
+        response = welcome_response
         assert response.status_code == 200
         
         content = response.text
@@ -43,9 +57,9 @@ class TestWebIntegration:
         assert "X-Frame-Options" in response.headers
         assert "X-Content-Type-Options" in response.headers
     
-    def test_demo_page_loads(self, client):
+    def test_demo_page_loads(self, demo_response):
         """Test that the demo page loads with all components."""
-        response = client.get("/demo")
+        response = demo_response
         assert response.status_code == 200
         
         content = response.text
@@ -159,17 +173,21 @@ class TestWebIntegration:
         response = client.post("/api/web/upload", data={"profile": "default"})
         assert response.status_code == 422  # Validation error
     
-    def test_security_features_active(self, client):
+    def test_security_features_active(self, welcome_response):
         """Test that security features are active."""
-        response = client.get("/")
+        response = welcome_response
         
-        # Check security headers
+        # Check security headers, reporting every missing one at once
         headers = response.headers
-        assert "X-Frame-Options" in headers
-        assert "X-Content-Type-Options" in headers
-        assert "X-XSS-Protection" in headers
-        assert "Content-Security-Policy" in headers
-        assert "Referrer-Policy" in headers
+        required = [
+            "X-Frame-Options",
+            "X-Content-Type-Options",
+            "X-XSS-Protection",
+            "Content-Security-Policy",
+            "Referrer-Policy",
+        ]
+        missing = [name for name in required if name not in headers]
+        assert not missing, f"Missing security headers: {missing}"
         
         # Check specific security values
         assert headers["X-Frame-Options"] == "DENY"
@@ -192,27 +210,24 @@ class TestWebIntegration:
             assert isinstance(profile_data["features"], list)
             assert len(profile_data["features"]) > 0
     
-    def test_responsive_design_elements(self, client):
+    def test_responsive_design_elements(self, welcome_response, demo_response):
         """Test that responsive design elements are present."""
         # Test welcome page
-        response = client.get("/")
-        content = response.text
+        content = welcome_response.text
         
         assert 'name="viewport"' in content
         assert 'content="width=device-width, initial-scale=1.0"' in content
         
         # Test demo page
-        response = client.get("/demo")
-        content = response.text
+        content = demo_response.text
         
         assert 'name="viewport"' in content
         assert 'class="demo-layout"' in content
         assert 'class="help-sidebar"' in content
     
-    def test_accessibility_features(self, client):
+    def test_accessibility_features(self, welcome_response):
         """Test basic accessibility features."""
-        response = client.get("/")
-        content = response.text
+        content = welcome_response.text
         
         # Check for semantic HTML
         assert '<main>' in content or '<main ' in content
@@ -224,10 +239,9 @@ class TestWebIntegration:
         assert '<h1>' in content
         assert '<h2>' in content
     
-    def test_javascript_integration(self, client):
+    def test_javascript_integration(self, demo_response):
         """Test JavaScript integration."""
-        response = client.get("/demo")
-        content = response.text
+        content = demo_response.text
         
         # Check for JavaScript files
         assert 'src="/static/js/demo.js"' in content
@@ -237,16 +251,14 @@ class TestWebIntegration:
         assert 'id="processBtn"' in content
         assert 'id="progressFill"' in content
     
-    def test_css_integration(self, client):
+    def test_css_integration(self, welcome_response, demo_response):
         """Test CSS integration."""
         # Test welcome page CSS
-        response = client.get("/")
-        content = response.text
+        content = welcome_response.text
         assert 'href="/static/css/welcome.css"' in content
         
         # Test demo page CSS
-        response = client.get("/demo")
-        content = response.text
+        content = demo_response.text
         assert 'href="/static/css/demo.css"' in content
     
     def test_api_documentation_integration(self, client):
@@ -274,40 +286,30 @@ class TestWebIntegration:
 class TestWebPerformance:
     """Basic performance tests for web interface."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        app = create_app()
-        return TestClient(app)
-    
     def test_page_load_times(self, client):
         """Test that pages load within reasonable time."""
-        import time
-        
         # Test welcome page
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = client.get("/")
-        load_time = time.time() - start_time
+        load_time = time.perf_counter() - start_time
         
         assert response.status_code == 200
         assert load_time < 5.0  # Should load within 5 seconds
         
         # Test demo page
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = client.get("/demo")
-        load_time = time.time() - start_time
+        load_time = time.perf_counter() - start_time
         
         assert response.status_code == 200
         assert load_time < 5.0  # Should load within 5 seconds
     
     def test_api_response_times(self, client):
         """Test API response times."""
-        import time
-        
         # Test profiles endpoint
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = client.get("/api/web/profiles")
-        response_time = time.time() - start_time
+        response_time = time.perf_counter() - start_time
         
         assert response.status_code == 200
         assert response_time < 2.0  # Should respond within 2 seconds
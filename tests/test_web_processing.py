@@ -3,31 +3,33 @@ Tests for web processing workflow.
 """
 
 import pytest
+from datetime import datetime
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock, AsyncMock
-import tempfile
 import json
-from pathlib import Path
 import io
 
 # Skip tests if web dependencies are not available
 try:
     from src.gopnik.interfaces.api.app import create_app
+    from src.gopnik.interfaces.web.processing import MAX_UPLOAD_SIZE
     WEB_AVAILABLE = True
 except ImportError:
     WEB_AVAILABLE = False
 
 
+@pytest.fixture(scope="module")
+def client():
+    """Create test client with web interface, shared across the module."""
+    app = create_app()
+    return TestClient(app)
+
+
 @pytest.mark.skipif(not WEB_AVAILABLE, reason="Web dependencies not available")
 class TestWebProcessing:
     """Test cases for web processing workflow."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client with web interface."""
-        app = create_app()
-        return TestClient(app)
-    
     @pytest.fixture
     def sample_pdf_file(self):
         """Create a sample PDF file for testing."""
@@ -108,56 +110,43 @@ class TestWebProcessing:
         assert data["current_step"] == "detect"
     
     @patch('src.gopnik.interfaces.web.processing.processing_manager')
-    def test_download_result_success(self, mock_manager, client):
+    def test_download_result_success(self, mock_manager, client, tmp_path):
         """Test successful file download."""
         # Create a temporary file for download
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            temp_file.write(b"fake pdf content")
-            temp_path = Path(temp_file.name)
+        temp_path = tmp_path / "result.pdf"
+        temp_path.write_bytes(b"fake pdf content")
+        
+        # Mock the processing manager
+        mock_manager.get_download_file = AsyncMock(return_value=temp_path)
+        mock_manager.get_job_status = AsyncMock(return_value={
+            "result": {"filename": "redacted_test.pdf"}
+        })
         
-        try:
-            # Mock the processing manager
-            mock_manager.get_download_file = AsyncMock(return_value=temp_path)
-            mock_manager.get_job_status = AsyncMock(return_value={
-                "result": {"filename": "redacted_test.pdf"}
-            })
-            
-            response = client.get("/api/web/jobs/test-job-id/download")
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "application/octet-stream"
-            
-        finally:
-            # Cleanup
-            temp_path.unlink(missing_ok=True)
+        response = client.get("/api/web/jobs/test-job-id/download")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/octet-stream"
     
     @patch('src.gopnik.interfaces.web.processing.processing_manager')
-    def test_download_audit_trail(self, mock_manager, client):
+    def test_download_audit_trail(self, mock_manager, client, tmp_path):
         """Test audit trail download."""
         # Create a temporary audit file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as temp_file:
-            audit_data = {"job_id": "test-job-id", "detections": []}
-            temp_file.write(json.dumps(audit_data).encode())
-            temp_path = Path(temp_file.name)
+        audit_data = {"job_id": "test-job-id", "detections": []}
+        temp_path = tmp_path / "audit.json"
+        temp_path.write_text(json.dumps(audit_data))
         
-        try:
-            # Mock the processing manager
-            mock_manager.get_job_status = AsyncMock(return_value={
-                "status": "completed",
-                "result": {"audit_file": str(temp_path)}
-            })
-            
-            response = client.get("/api/web/jobs/test-job-id/audit")
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "application/json"
-            
-        finally:
-            # Cleanup
-            temp_path.unlink(missing_ok=True)
+        # Mock the processing manager
+        mock_manager.get_job_status = AsyncMock(return_value={
+            "status": "completed",
+            "result": {"audit_file": str(temp_path)}
+        })
+        
+        response = client.get("/api/web/jobs/test-job-id/audit")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
     
     @patch('src.gopnik.interfaces.web.processing.processing_manager')
     def test_job_not_found(self, mock_manager, client):
         """Test handling of non-existent job."""
-        from fastapi import HTTPException
         mock_manager.get_job_status = AsyncMock(
             side_effect=HTTPException(status_code=404, detail="Job not found")
         )
@@ -195,8 +184,8 @@ class TestWebProcessing:
     
     def test_upload_large_file(self, client):
         """Test upload with file too large."""
-        # Create a large file (simulate 15MB)
-        large_content = io.BytesIO(b"x" * (15 * 1024 * 1024))
+        # Create a file one byte over the upload limit
+        large_content = io.BytesIO(b"x" * (MAX_UPLOAD_SIZE + 1))
         
         response = client.post(
             "/api/web/upload",
@@ -254,7 +243,6 @@ class TestWebProcessingManager:
     def test_job_model_validation(self):
         """Test WebProcessingJob model validation."""
         from src.gopnik.interfaces.web.processing import WebProcessingJob
-        from datetime import datetime
         
         job = WebProcessingJob(
             job_id="test-id",
@@ -3,9 +3,7 @@ Tests for web security features.
 """
 
 import pytest
-import tempfile
-import time
-from pathlib import Path
+from datetime import timedelta
 from unittest.mock import patch, MagicMock
 from fastapi.testclient import TestClient
 from fastapi import Request
@@ -22,6 +20,13 @@ except ImportError:
     WEB_AVAILABLE = False
 
 
+@pytest.fixture(scope="module")
+def client():
+    """Create test client with web interface, shared across the module."""
+    app = create_app()
+    return TestClient(app)
+
+
 @pytest.mark.skipif(not WEB_AVAILABLE, reason="Web dependencies not available")
 class TestSecurityHeaders:
     """Test security headers functionality."""
@@ -105,8 +110,8 @@ class TestSessionManager:
         session = manager.get_session(session_id)
         assert session is not None
         
-        # Wait for expiration
-        time.sleep(2)
+        # Age the session past its timeout
+        manager.sessions[session_id]["last_accessed"] -= timedelta(seconds=2)
         
         # Session should be expired and removed
         session = manager.get_session(session_id)
@@ -123,8 +128,9 @@ class TestSessionManager:
         
         assert len(manager.sessions) == 2
         
-        # Wait for expiration
-        time.sleep(2)
+        # Age both sessions past their timeout
+        for session in manager.sessions.values():
+            session["last_accessed"] -= timedelta(seconds=2)
         
         # Cleanup expired sessions
         manager.cleanup_expired_sessions()
@@ -160,12 +166,11 @@ class TestSecureFileHandler:
         assert "passwd" not in filename
         assert filename.endswith(".pdf")
     
-    def test_secure_delete(self):
+    def test_secure_delete(self, tmp_path):
         """Test secure file deletion."""
         # Create a temporary file
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_file.write(b"sensitive data")
-            temp_path = Path(temp_file.name)
+        temp_path = tmp_path / "sensitive.bin"
+        temp_path.write_bytes(b"sensitive data")
         
         # File should exist
         assert temp_path.exists()
@@ -176,31 +181,33 @@ class TestSecureFileHandler:
         # File should be gone
         assert not temp_path.exists()
     
-    def test_validate_file_content_pdf(self):
+    def test_validate_file_content_pdf(self, tmp_path):
         """Test PDF file content validation."""
         # Create a fake PDF file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            temp_file.write(b"%PDF-1.4\nfake pdf content")
-            temp_path = Path(temp_file.name)
-        
-        try:
-            result = SecureFileHandler.validate_file_content(temp_path, "application/pdf")
-            assert result is True
-        finally:
-            temp_path.unlink(missing_ok=True)
+        temp_path = tmp_path / "document.pdf"
+        temp_path.write_bytes(b"%PDF-1.4\nfake pdf content")
+        
+        result = SecureFileHandler.validate_file_content(temp_path, "application/pdf")
+        assert result is True
     
-    def test_validate_file_content_invalid_pdf(self):
+    def test_validate_file_content_invalid_pdf(self, tmp_path):
         """Test invalid PDF file content validation."""
         # Create a fake file with wrong content
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            temp_file.write(b"This is not a PDF file")
-            temp_path = Path(temp_file.name)
-        
-        try:
-            result = SecureFileHandler.validate_file_content(temp_path, "application/pdf")
-            assert result is False
-        finally:
-            temp_path.unlink(missing_ok=True)
+        temp_path = tmp_path / "document.pdf"
+        temp_path.write_bytes(b"This is not a PDF file")
+        
+        result = SecureFileHandler.validate_file_content(temp_path, "application/pdf")
+        assert result is False
+
+
+    def test_validate_file_header(self):
+        """Test magic-byte validation on in-memory headers."""
+        assert SecureFileHandler.validate_file_header(b"%PDF-1.4\nfake", "application/pdf") is True
+        assert SecureFileHandler.validate_file_header(b"This is not a PDF file", "application/pdf") is False
+        assert SecureFileHandler.validate_file_header(b"\x89PNG\r\n\x1a\n", "image/png") is True
+        assert SecureFileHandler.validate_file_header(b"\xff\xd8\xff\xe0", "image/jpeg") is True
+        assert SecureFileHandler.validate_file_header(b"MM\x00*", "image/tiff") is True
+        assert SecureFileHandler.validate_file_header(b"", "image/png") is False
 
 
 @pytest.mark.skipif(not WEB_AVAILABLE, reason="Web dependencies not available")
@@ -348,33 +355,43 @@ class TestRateLimitMiddleware:
         
         ip = middleware._get_client_ip(mock_request)
         assert ip == "1.2.3.4"
+    
+    def test_is_rate_limited_counts_per_client(self):
+        """Test the per-request rate limit check without an HTTP round trip."""
+        from fastapi import FastAPI
+        
+        app = FastAPI()
+        middleware = RateLimitMiddleware(app, calls=1000, period=60)
+        
+        # The first `calls` requests are allowed, the next one is limited
+        for _ in range(1000):
+            assert middleware._is_rate_limited("1.1.1.1") is False
+        assert middleware._is_rate_limited("1.1.1.1") is True
+        
+        # Other clients keep their own budget
+        assert middleware._is_rate_limited("2.2.2.2") is False
+        
+        # Requests older than the period fall out of the window
+        window = middleware.clients["1.1.1.1"]
+        for i in range(len(window)):
+            window[i] -= 120
+        assert middleware._is_rate_limited("1.1.1.1") is False
+        assert len(window) == 1
 
 
 @pytest.mark.skipif(not WEB_AVAILABLE, reason="Web dependencies not available")
 class TestSecurityIntegration:
     """Test security integration with FastAPI app."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client with security middleware."""
-        app = create_app()
-        return TestClient(app)
-    
     def test_security_headers_in_response(self, client):
         """Test that security headers are added to responses."""
         response = client.get("/")
+        assert response.status_code == 200
         
         # Check for security headers
         assert "X-Content-Type-Options" in response.headers
         assert "X-Frame-Options" in response.headers
         assert response.headers["X-Frame-Options"] == "DENY"
-    
-    def test_rate_limiting_protection(self, client):
-        """Test rate limiting protection."""
-        # This test would need to make many requests to trigger rate limiting
-        # For now, just test that the endpoint is accessible
-        response = client.get("/")
-        assert response.status_code == 200
 
 
 if __name__ == "__main__":
@@ -11,21 +11,31 @@ from pathlib import Path
 # Skip tests if web dependencies are not available
 try:
     from src.gopnik.interfaces.api.app import create_app
+    from src.gopnik.interfaces.web.routes import STATIC_DIR
     WEB_AVAILABLE = True
 except ImportError:
     WEB_AVAILABLE = False
 
 
+@pytest.fixture(scope="module")
+def client():
+    """Create test client with web interface, shared across the module."""
+    app = create_app()
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def welcome_html(client):
+    """Render the welcome page once and share its HTML across the module."""
+    response = client.get("/")
+    assert response.status_code == 200
+    return response.text
+
+
 @pytest.mark.skipif(not WEB_AVAILABLE, reason="Web dependencies not available")
 class TestWelcomePage:
     """Test cases for the welcome page functionality."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client with web interface."""
-        app = create_app()
-        return TestClient(app)
-    
     def test_welcome_page_loads(self, client):
         """Test that the welcome page loads successfully."""
         response = client.get("/")
@@ -38,51 +48,63 @@ class TestWelcomePage:
         assert "AI-Powered Deidentification" in content
         assert "Forensic-Grade Document Deidentification" in content
     
-    def test_welcome_page_contains_navigation(self, client):
+    def test_welcome_page_contains_navigation(self, welcome_html):
         """Test that the welcome page contains proper navigation."""
-        response = client.get("/")
-        content = response.text
+        content = welcome_html
         
         # Check for navigation elements
-        assert 'href="#features"' in content
-        assert 'href="#versions"' in content
-        assert 'href="#docs"' in content
-        assert 'href="/demo"' in content
+        required = [
+            'href="#features"',
+            'href="#versions"',
+            'href="#docs"',
+            'href="/demo"',
+        ]
+        missing = [text for text in required if text not in content]
+        assert not missing, f"Missing from welcome page: {missing}"
     
-    def test_welcome_page_contains_features(self, client):
+    def test_welcome_page_contains_features(self, welcome_html):
         """Test that the welcome page contains feature descriptions."""
-        response = client.get("/")
-        content = response.text
+        content = welcome_html
         
         # Check for key features
-        assert "AI-Powered Detection" in content
-        assert "Forensic-Grade Security" in content
-        assert "Multiple Interfaces" in content
-        assert "Configurable Profiles" in content
-        assert "Batch Processing" in content
-        assert "Integrity Validation" in content
+        required = [
+            "AI-Powered Detection",
+            "Forensic-Grade Security",
+            "Multiple Interfaces",
+            "Configurable Profiles",
+            "Batch Processing",
+            "Integrity Validation",
+        ]
+        missing = [text for text in required if text not in content]
+        assert not missing, f"Missing from welcome page: {missing}"
     
-    def test_welcome_page_contains_versions(self, client):
+    def test_welcome_page_contains_versions(self, welcome_html):
         """Test that the welcome page contains version information."""
-        response = client.get("/")
-        content = response.text
+        content = welcome_html
         
         # Check for version cards
-        assert "Web Demo" in content
-        assert "CLI Tool" in content
-        assert "REST API" in content
-        assert "pip install gopnik" in content
+        required = [
+            "Web Demo",
+            "CLI Tool",
+            "REST API",
+            "pip install gopnik",
+        ]
+        missing = [text for text in required if text not in content]
+        assert not missing, f"Missing from welcome page: {missing}"
     
-    def test_welcome_page_contains_getting_started(self, client):
+    def test_welcome_page_contains_getting_started(self, welcome_html):
         """Test that the welcome page contains getting started guides."""
-        response = client.get("/")
-        content = response.text
+        content = welcome_html
         
         # Check for guide links
-        assert "Quick Start Guide" in content
-        assert "CLI Reference" in content
-        assert "API Integration" in content
-        assert "Security Guide" in content
+        required = [
+            "Quick Start Guide",
+            "CLI Reference",
+            "API Integration",
+            "Security Guide",
+        ]
+        missing = [text for text in required if text not in content]
+        assert not missing, f"Missing from welcome page: {missing}"
     
     def test_demo_page_redirect(self, client):
         """Test that the demo page loads (currently redirects to welcome)."""
@@ -97,11 +119,12 @@ class TestWelcomePage:
     
     def test_static_files_mount(self, client):
         """Test that static files are properly mounted."""
-        # This test might fail if static files don't exist yet
-        # but should pass once the files are in place
+        # Only meaningful when the stylesheet ships with the package
+        if not (STATIC_DIR / "css" / "welcome.css").is_file():
+            pytest.skip("welcome.css is not present in the static directory")
+        
         response = client.get("/static/css/welcome.css")
-        # Accept 404 for now since files might not be accessible in test environment
-        assert response.status_code in [200, 404]
+        assert response.status_code == 200
     
     @patch('src.gopnik.interfaces.web.routes.templates')
     def test_welcome_page_template_error_handling(self, mock_templates, client):
@@ -111,10 +134,9 @@ class TestWelcomePage:
         response = client.get("/")
         assert response.status_code == 500
     
-    def test_welcome_page_responsive_elements(self, client):
+    def test_welcome_page_responsive_elements(self, welcome_html):
         """Test that the welcome page contains responsive design elements."""
-        response = client.get("/")
-        content = response.text
+        content = welcome_html
         
         # Check for responsive CSS classes and viewport meta tag
         assert 'name="viewport"' in content